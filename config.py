@@ -18,6 +18,7 @@ VIRTUAL_GRID_HEIGHT = 512
 DEFAULT_SPEED = 10  # generations per second
 MIN_SPEED = 1
 MAX_SPEED = 60
+MAX_STEPS_PER_FRAME = 8  # Catch-up cap after a stall; older backlog is dropped
 
 # Wrap mode: 'toroidal' (wrapping) or 'bounded'
 WRAP_MODE = 'toroidal'
@@ -35,6 +36,9 @@ JOYSTICK_DEADZONE = 0.2
 PAN_SPEED = 5  # cells per frame when panning
 CURSOR_SPEED = 0.5  # cells per frame for smooth cursor movement
 
+# Frame pacing
+IDLE_FRAME_MS = 33  # Idle states block for input up to this long (~30 FPS)
+
 # Paths
 import os
 USER_PATTERNS_DIR = os.path.expanduser('~/conway/user_patterns')
@@ -3,6 +3,12 @@ import pygame
 import math
 from typing import Tuple, Optional
 
+# Sine table for per-star twinkle: SIN_LUT[int(x * SIN_LUT_SCALE) & SIN_LUT_MASK] ~ sin(x)
+SIN_LUT_SIZE = 1024
+SIN_LUT_MASK = SIN_LUT_SIZE - 1
+SIN_LUT_SCALE = SIN_LUT_SIZE / math.tau
+SIN_LUT = [math.sin(i / SIN_LUT_SCALE) for i in range(SIN_LUT_SIZE)]
+
 
 class Effects:
     """Visual effects manager."""
@@ -21,6 +27,9 @@ class Effects:
         self._vignette_surface = None
         self._create_vignette_surface()
 
+        # Scanlines and vignette pre-blended into one overlay
+        self._crt_surface = None
+
         # Cell glow
         self.cell_glow_enabled = True
         self.cell_border_enabled = True
@@ -59,6 +68,21 @@ class Effects:
                 if alpha > 10:
                     self._vignette_surface.set_at((x, y), (0, 0, 0, alpha))
 
+    def _create_crt_surface(self):
+        """Combine scanlines and vignette so both cost a single blit."""
+        self._crt_surface = self._scanline_surface.copy()
+        self._crt_surface.blit(self._vignette_surface, (0, 0))
+
+    def apply_crt(self, screen: pygame.Surface):
+        """Apply the enabled scanline and vignette effects to screen."""
+        if self.scanlines_enabled and self.vignette_enabled:
+            if self._crt_surface is None:
+                self._create_crt_surface()
+            screen.blit(self._crt_surface, (0, 0))
+        else:
+            self.apply_scanlines(screen)
+            self.apply_vignette(screen)
+
     def apply_scanlines(self, screen: pygame.Surface):
         """Apply scanline effect to screen."""
         if self.scanlines_enabled and self._scanline_surface:
@@ -1,5 +1,6 @@
 """8-bit pixel font for retro aesthetic."""
 import pygame
+import numpy as np
 from typing import Tuple, Dict
 
 # 5x7 pixel font data - each character is a list of 7 rows, each row is 5 bits
@@ -57,6 +58,22 @@ FONT_DATA: Dict[str, list] = {
 CHAR_WIDTH = 5
 CHAR_HEIGHT = 7
 
+# Column bit masks, leftmost column first
+_COLUMN_BITS = 1 << np.arange(CHAR_WIDTH - 1, -1, -1)
+
+
+def _glyph_mask(rows: list, scale: int) -> np.ndarray:
+    """Expand a glyph's row bits to a (height, width) bool mask at scale px per bit."""
+    bits = (np.array(rows)[:, None] & _COLUMN_BITS) != 0
+    return np.kron(bits, np.ones((scale, scale), dtype=bool))
+
+
+def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a surface to the display pixel format once a display exists."""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
 
 class PixelFont:
     """Retro 8-bit pixel font renderer."""
@@ -71,6 +88,11 @@ class PixelFont:
         self.scale = scale
         self._char_cache: Dict[Tuple[str, Tuple[int, int, int]], pygame.Surface] = {}
 
+        # Every glyph pre-scaled once; colored surfaces are built from these
+        self._glyph_masks: Dict[str, np.ndarray] = {
+            char: _glyph_mask(rows, scale) for char, rows in FONT_DATA.items()
+        }
+
     def _render_char(self, char: str, color: Tuple[int, int, int]) -> pygame.Surface:
         """Render a single character to a surface."""
         cache_key = (char, color)
@@ -82,19 +104,19 @@ class PixelFont:
 
         surface = pygame.Surface((width, height), pygame.SRCALPHA)
 
-        char_data = FONT_DATA.get(char.upper(), FONT_DATA.get(' '))
-        if char_data is None:
-            char_data = FONT_DATA[' ']
+        mask = self._glyph_masks.get(char.upper())
+        if mask is None:
+            mask = self._glyph_masks[' ']
+        mask = mask.T  # surfarray indexes (x, y)
 
-        for row_idx, row in enumerate(char_data):
-            for col_idx in range(CHAR_WIDTH):
-                # Check if bit is set (from left to right)
-                if row & (1 << (CHAR_WIDTH - 1 - col_idx)):
-                    x = col_idx * self.scale
-                    y = row_idx * self.scale
-                    pygame.draw.rect(surface, color,
-                                   (x, y, self.scale, self.scale))
+        rgb = pygame.surfarray.pixels3d(surface)
+        rgb[mask] = color
+        del rgb
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[mask] = 255
+        del alpha  # Unlock the surface
 
+        surface = _to_display_format(surface)
         self._char_cache[cache_key] = surface
         return surface
 
@@ -120,13 +142,13 @@ class PixelFont:
 
         surface = pygame.Surface((total_width, char_height), pygame.SRCALPHA)
 
-        x = 0
-        for char in text:
-            char_surface = self._render_char(char, color)
-            surface.blit(char_surface, (x, 0))
-            x += char_width + spacing
+        advance = char_width + spacing
+        surface.blits([
+            (self._render_char(char, color), (i * advance, 0))
+            for i, char in enumerate(text)
+        ], doreturn=False)
 
-        return surface
+        return _to_display_format(surface)
 
     def render_with_shadow(self, text: str, color: Tuple[int, int, int],
                            shadow_color: Tuple[int, int, int] = (0, 0, 0),
@@ -147,7 +169,7 @@ class PixelFont:
         main = self.render(text, color)
         surface.blit(main, (0, 0))
 
-        return surface
+        return _to_display_format(surface)
 
     def get_size(self, text: str, spacing: int = 1) -> Tuple[int, int]:
         """Get the size of rendered text."""
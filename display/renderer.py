@@ -43,6 +43,7 @@ class Renderer:
 
         # Pre-render surfaces for performance
         self._cell_surfaces = {}
+        self._preview_tiles = {}
 
         # Grid lines toggle
         self.show_grid_lines = config.SHOW_GRID_LINES
@@ -62,6 +63,7 @@ class Renderer:
         if theme_name in THEMES:
             self.theme = THEMES[theme_name]
             self._cell_surfaces.clear()  # Clear cached surfaces
+            self._preview_tiles.clear()
 
     def cycle_theme(self) -> str:
         """Cycle to the next color theme. Returns new theme name."""
@@ -87,6 +89,15 @@ class Renderer:
             self._cell_surfaces[key] = surf
         return self._cell_surfaces[key]
 
+    def _get_preview_tile(self, cell_size: int, alpha: int) -> pygame.Surface:
+        """Get or create a cached translucent cell for pattern previews."""
+        key = (cell_size, alpha)
+        if key not in self._preview_tiles:
+            surf = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+            surf.fill((*self.theme.cell_alive, alpha))
+            self._preview_tiles[key] = surf
+        return self._preview_tiles[key]
+
     def clear(self):
         """Clear the screen."""
         self.screen.fill(self.theme.background)
@@ -176,22 +187,14 @@ class Renderer:
         cell_size = viewport.cell_size
         base_x, base_y = viewport.cell_to_screen(cursor_x, cursor_y)
 
-        h, w = pattern_data.shape
-
-        # Create transparent surface
-        preview = pygame.Surface((w * cell_size, h * cell_size), pygame.SRCALPHA)
-
-        for row in range(h):
-            for col in range(w):
-                if pattern_data[row, col]:
-                    color = (*self.theme.cell_alive, alpha)
-                    pygame.draw.rect(
-                        preview,
-                        color,
-                        (col * cell_size, row * cell_size, cell_size, cell_size)
-                    )
-
-        self.screen.blit(preview, (base_x, base_y))
+        # Cells never overlap, so blending each tile straight onto the
+        # screen matches drawing them on one layer and blitting that
+        tile = self._get_preview_tile(cell_size, alpha)
+        rows, cols = np.nonzero(pattern_data)
+        self.screen.blits([
+            (tile, (base_x + col * cell_size, base_y + row * cell_size))
+            for row, col in zip(rows.tolist(), cols.tolist())
+        ], doreturn=False)
 
     def render_text(self, text: str, x: int, y: int, size: str = 'small',
                     color: Optional[Tuple[int, int, int]] = None,
@@ -230,8 +233,7 @@ class Renderer:
     def flip(self, apply_effects: bool = True):
         """Update the display."""
         if apply_effects:
-            self.effects.apply_scanlines(self.screen)
-            self.effects.apply_vignette(self.screen)
+            self.effects.apply_crt(self.screen)
         pygame.display.flip()
 
     def toggle_scanlines(self) -> bool:
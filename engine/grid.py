@@ -20,11 +20,20 @@ class Grid:
         self.wrap_mode = wrap_mode
         self.cells = np.zeros((height, width), dtype=np.uint8)
         self.generation = 0
+        self._population: Optional[int] = None  # Live-cell count; None = recount
+
+        # Scratch buffers reused by every step
+        self._padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+        self._neighbors = np.empty((height, width), dtype=np.uint8)
+        self._next_cells = np.empty((height, width), dtype=np.uint8)
+        self._born = np.empty((height, width), dtype=np.bool_)
+        self._survives = np.empty((height, width), dtype=np.bool_)
 
     def clear(self):
         """Clear all cells."""
         self.cells.fill(0)
         self.generation = 0
+        self._population = 0
 
     def get_cell(self, x: int, y: int) -> bool:
         """Get cell state at position."""
@@ -43,6 +52,7 @@ class Grid:
         elif not (0 <= x < self.width and 0 <= y < self.height):
             return
         self.cells[y, x] = 1 if alive else 0
+        self._population = None
 
     def toggle_cell(self, x: int, y: int):
         """Toggle cell state at position."""
@@ -52,42 +62,83 @@ class Grid:
         elif not (0 <= x < self.width and 0 <= y < self.height):
             return
         self.cells[y, x] = 1 - self.cells[y, x]
+        self._population = None
 
     def count_neighbors(self) -> np.ndarray:
-        """Count neighbors for all cells using numpy convolution."""
-        # Pad array based on wrap mode
+        """
+        Count live neighbors for all cells.
+
+        The result is written into a buffer reused across calls, so it is only
+        valid until the next count.
+        """
+        h, w = self.height, self.width
+        p = self._padded
+        p[1:h+1, 1:w+1] = self.cells
         if self.wrap_mode == 'toroidal':
-            padded = np.pad(self.cells, 1, mode='wrap')
+            # Opposite edges (columns copied after rows so corners wrap too)
+            p[0, 1:w+1] = self.cells[h-1]
+            p[h+1, 1:w+1] = self.cells[0]
+            p[:, 0] = p[:, w]
+            p[:, w+1] = p[:, 1]
         else:
-            padded = np.pad(self.cells, 1, mode='constant', constant_values=0)
-
-        # Count neighbors by shifting and summing
-        neighbors = np.zeros_like(self.cells, dtype=np.uint8)
-        for dy in [-1, 0, 1]:
-            for dx in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                neighbors += padded[1+dy:1+dy+self.height, 1+dx:1+dx+self.width]
-
+            # Border may hold wrapped cells from an earlier toroidal count
+            p[0] = 0
+            p[h+1] = 0
+            p[:, 0] = 0
+            p[:, w+1] = 0
+
+        # Accumulate the 8 shifted views in place
+        neighbors = self._neighbors
+        np.add(p[0:h, 0:w], p[0:h, 1:w+1], out=neighbors)
+        neighbors += p[0:h, 2:w+2]
+        neighbors += p[1:h+1, 0:w]
+        neighbors += p[1:h+1, 2:w+2]
+        neighbors += p[2:h+2, 0:w]
+        neighbors += p[2:h+2, 1:w+1]
+        neighbors += p[2:h+2, 2:w+2]
         return neighbors
 
     def step(self):
         """Advance simulation by one generation using B3/S23 rules."""
-        neighbors = self.count_neighbors()
+        self.step_n(1)
+
+    def step_n(self, n: int):
+        """
+        Advance simulation by n generations using B3/S23 rules.
 
-        # B3/S23 rules:
-        # - Birth: dead cell with exactly 3 neighbors becomes alive
-        # - Survival: live cell with 2 or 3 neighbors stays alive
-        # - Death: all other cells die
-        birth = (self.cells == 0) & (neighbors == 3)
-        survive = (self.cells == 1) & ((neighbors == 2) | (neighbors == 3))
+        The next generation is written into a spare cell buffer which is then
+        swapped with self.cells, so stepping allocates nothing.
+        """
+        if n <= 0:
+            return
+
+        born = self._born
+        survives = self._survives
+        for _ in range(n):
+            neighbors = self.count_neighbors()
+
+            # B3/S23 rules:
+            # - Birth: dead cell with exactly 3 neighbors becomes alive
+            # - Survival: live cell with 2 or 3 neighbors stays alive
+            # - Death: all other cells die
+            np.equal(neighbors, 3, out=born)
+            np.equal(neighbors, 2, out=survives)
+            survives &= self.cells.view(np.bool_)
+            born |= survives
 
-        self.cells = (birth | survive).astype(np.uint8)
-        self.generation += 1
+            nxt = self._next_cells
+            np.copyto(nxt, born)
+            self._next_cells = self.cells
+            self.cells = nxt
+
+        self.generation += n
+        self._population = None
 
     def population(self) -> int:
-        """Return count of living cells."""
-        return int(np.sum(self.cells))
+        """Return count of living cells (counted once per change to the grid)."""
+        if self._population is None:
+            self._population = int(np.count_nonzero(self.cells))
+        return self._population
 
     def load_pattern(self, pattern_data: np.ndarray, x: int, y: int,
                      rotation: int = 0):
@@ -103,12 +154,19 @@ class Grid:
         rotations = (rotation // 90) % 4
         data = np.rot90(pattern_data, -rotations)  # Negative for clockwise
 
-        ph, pw = data.shape
-
-        for py in range(ph):
-            for px in range(pw):
-                if data[py, px]:
-                    self.set_cell(x + px, y + py, True)
+        # Set all live cells in one indexed assignment
+        ys, xs = np.nonzero(data)
+        ys = ys + y
+        xs = xs + x
+        if self.wrap_mode == 'toroidal':
+            ys %= self.height
+            xs %= self.width
+        else:
+            inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+            ys = ys[inside]
+            xs = xs[inside]
+        self.cells[ys, xs] = 1
+        self._population = None
 
     def get_region(self, x: int, y: int, width: int, height: int) -> np.ndarray:
         """Get a region of the grid for rendering."""
@@ -138,3 +196,4 @@ class Grid:
         """Fill grid with random cells."""
         self.cells = (np.random.random((self.height, self.width)) < density).astype(np.uint8)
         self.generation = 0
+        self._population = None
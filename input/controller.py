@@ -2,6 +2,7 @@
 import pygame
 import json
 import os
+import time
 from typing import Dict, Optional
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -29,6 +30,11 @@ class Button(Enum):
     DPAD_LEFT = auto()
     DPAD_RIGHT = auto()
 
+    @property
+    def mask(self) -> int:
+        """This button's bit in ControllerInput.just_pressed_mask()."""
+        return 1 << self.value
+
 
 class Axis(Enum):
     """Controller axis mappings."""
@@ -105,6 +111,10 @@ class ControllerInput:
             axes={a: 0.0 for a in Axis}
         )
 
+        # Button.mask bitfields, recomputed once per update()
+        self._down_mask = 0
+        self._pressed_mask = 0
+
         # Try to connect to first available controller
         self._detect_controller()
 
@@ -177,6 +187,7 @@ class ControllerInput:
             self.state.connected = False
 
         if not self.joystick:
+            self._update_masks()
             return
 
         # Update button states
@@ -198,6 +209,17 @@ class ControllerInput:
                     value = -value
                 self.state.axes[axis_enum] = value
 
+        self._update_masks()
+
+    def _update_masks(self):
+        """Fold this frame's buttons into the held and just-pressed bitfields."""
+        down = 0
+        for button, is_down in self.state.buttons.items():
+            if is_down:
+                down |= button.mask
+        self._pressed_mask = down & ~self._down_mask
+        self._down_mask = down
+
     def _apply_deadzone(self, value: float) -> float:
         """Apply deadzone to axis value."""
         if abs(value) < self.deadzone:
@@ -212,8 +234,11 @@ class ControllerInput:
 
     def just_pressed(self, button: Button) -> bool:
         """Check if a button was just pressed this frame."""
-        return (self.state.buttons.get(button, False) and
-                not self.prev_state.buttons.get(button, False))
+        return bool(self._pressed_mask & button.mask)
+
+    def just_pressed_mask(self) -> int:
+        """Get all buttons just pressed this frame as a bitmask of Button.mask bits."""
+        return self._pressed_mask
 
     def just_released(self, button: Button) -> bool:
         """Check if a button was just released this frame."""
@@ -242,3 +267,62 @@ class ControllerInput:
     def connected(self) -> bool:
         """Check if a controller is connected."""
         return self.state.connected
+
+
+class AxisRepeat:
+    """
+    Turns a stick axis into discrete steps, like a held key.
+
+    Pushing past the threshold steps at once; holding it repeats, faster
+    the further the stick is pushed. Releasing re-arms the instant step.
+    """
+
+    def __init__(self, threshold: float = 0.5, slowest: float = 0.3,
+                 fastest: float = 0.15):
+        """
+        Initialize the repeater.
+
+        Args:
+            threshold: Deflection needed to step
+            slowest: Repeat delay in seconds at the threshold
+            fastest: Repeat delay in seconds at full deflection
+        """
+        self.threshold = threshold
+        self.slowest = slowest
+        self.fastest = fastest
+        self.held = 0  # Direction currently held: -1, 0 or 1
+        self._ready_at = 0.0  # time.monotonic() deadline for the next repeat
+
+    def update(self, value: float) -> int:
+        """
+        Feed this frame's axis value.
+
+        Returns:
+            -1 or 1 to step in that direction this frame, else 0
+        """
+        if value < -self.threshold:
+            direction = -1
+        elif value > self.threshold:
+            direction = 1
+        else:
+            direction = 0
+
+        if direction != self.held:
+            # Pushed, released or flipped: the first step never waits
+            self.held = direction
+            if direction:
+                self._ready_at = time.monotonic() + self._repeat_delay(value)
+            return direction
+
+        if direction:
+            now = time.monotonic()
+            if now >= self._ready_at:
+                self._ready_at = now + self._repeat_delay(value)
+                return direction
+        return 0
+
+    def _repeat_delay(self, value: float) -> float:
+        """Delay until the next repeat, easing from slowest to fastest."""
+        t = (abs(value) - self.threshold) / (1.0 - self.threshold)
+        t = min(1.0, max(0.0, t))
+        return self.slowest + (self.fastest - self.slowest) * t
@@ -35,6 +35,14 @@ class Game:
         pygame.init()
         pygame.mouse.set_visible(False)
 
+        # No state uses the mouse; keep its events out of the queue
+        pygame.event.set_blocked([
+            pygame.MOUSEMOTION,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEBUTTONUP,
+            pygame.MOUSEWHEEL,
+        ])
+
         # Create core components
         self.grid = Grid(
             config.VIRTUAL_GRID_WIDTH,
@@ -57,6 +65,7 @@ class Game:
         # Input handlers
         self.controller = ControllerInput()
         self.keyboard = KeyboardInput()
+        self.keys = pygame.key.get_pressed()  # Held keys, sampled once per frame
 
         # UI components
         self.hud = HUD()
@@ -94,19 +103,30 @@ class Game:
     def run(self):
         """Main game loop."""
         while self.running:
+            # Idle states sleep until input arrives instead of polling
+            events = []
+            timeout = self.state_machine.idle_timeout()
+            if timeout:
+                event = pygame.event.wait(timeout)
+                if event.type != pygame.NOEVENT:
+                    events.append(event)
+
             # Calculate delta time
             dt = self.clock.tick(self.target_fps) / 1000.0
 
-            # Handle events
-            events = pygame.event.get()
+            # Handle events (drained once per frame, dispatched as a batch)
+            events += pygame.event.get()
+            state_events = []
             for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
                 else:
-                    self.state_machine.handle_event(event)
+                    state_events.append(event)
+            self.state_machine.handle_events(state_events)
 
             # Update keyboard state
             self.keyboard.update(events)
+            self.keys = pygame.key.get_pressed()
 
             # Update current state
             self.state_machine.update(dt)
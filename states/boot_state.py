@@ -1,10 +1,10 @@
 """Boot/splash screen state with animated title."""
 import pygame
 import random
-import math
 from typing import Optional, List, Tuple
 from .state_machine import State
 from display.pixelfont import PixelFont
+from display.effects import SIN_LUT, SIN_LUT_MASK, SIN_LUT_SCALE
 from input.controller import Button
 
 
@@ -187,8 +187,7 @@ class BootState(State):
 
         # Apply effects
         if hasattr(renderer, 'effects'):
-            renderer.effects.apply_scanlines(screen)
-            renderer.effects.apply_vignette(screen)
+            renderer.effects.apply_crt(screen)
 
         renderer.flip()
 
@@ -244,11 +243,12 @@ class BootState(State):
 
     def _draw_stars(self, screen: pygame.Surface):
         """Draw twinkling stars background."""
-        import math
+        sin_lut = SIN_LUT
         for star in self.stars:
             x, y, base_brightness, speed, phase = star
             # Calculate twinkling brightness
-            twinkle = (math.sin(self.elapsed * speed + phase) + 1) / 2
+            angle = self.elapsed * speed + phase
+            twinkle = (sin_lut[int(angle * SIN_LUT_SCALE) & SIN_LUT_MASK] + 1) / 2
             brightness = base_brightness * (0.3 + 0.7 * twinkle)
 
             # Mix of primary and secondary star colors from theme
@@ -1,11 +1,11 @@
 """Colophon state displaying credits and version info."""
 import pygame
 import random
-import math
 import os
 from typing import Optional, List, Tuple
 from .state_machine import State
 from display.pixelfont import PixelFont
+from display.effects import SIN_LUT, SIN_LUT_MASK, SIN_LUT_SCALE
 from input.controller import Button
 import config
 
@@ -95,7 +95,8 @@ class ColophonState(State):
             brightness = random.uniform(0.2, 1.0)
             speed = random.uniform(0.5, 2.0)
             phase = random.uniform(0, 6.28)
-            self.stars.append([x, y, brightness, speed, phase])
+            is_secondary = random.random() > 0.7  # Fixed color per star
+            self.stars.append([x, y, brightness, speed, phase, is_secondary])
 
     def enter(self, prev_state=None):
         self.elapsed = 0.0
@@ -137,22 +138,20 @@ class ColophonState(State):
 
         # Apply effects
         if hasattr(renderer, 'effects'):
-            renderer.effects.apply_scanlines(screen)
-            renderer.effects.apply_vignette(screen)
+            renderer.effects.apply_crt(screen)
 
         renderer.flip()
 
     def _draw_stars(self, screen: pygame.Surface):
         """Draw twinkling stars background."""
+        sin_lut = SIN_LUT
         for star in self.stars:
-            x, y, base_brightness, speed, phase = star
-            twinkle = (math.sin(self.elapsed * speed + phase) + 1) / 2
+            x, y, base_brightness, speed, phase, is_secondary = star
+            angle = self.elapsed * speed + phase
+            twinkle = (sin_lut[int(angle * SIN_LUT_SCALE) & SIN_LUT_MASK] + 1) / 2
             brightness = base_brightness * (0.3 + 0.7 * twinkle)
 
-            if random.random() > 0.7:
-                base = self.theme.star_secondary
-            else:
-                base = self.theme.star_primary
+            base = self.theme.star_secondary if is_secondary else self.theme.star_primary
             color = (int(base[0] * brightness), int(base[1] * brightness), int(base[2] * brightness))
 
             size = 2 if brightness > 0.7 else 1
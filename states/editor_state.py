@@ -1,30 +1,72 @@
 """Editor state - cell editing mode."""
 import pygame
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from .state_machine import State
-from input.controller import Button
-from ui.menu import PatternBrowser
+from input.controller import Button, AxisRepeat
 from engine.patterns import PatternLoader
 import config
 
+if TYPE_CHECKING:
+    from ui.menu import PatternBrowser
+
 
 class EditorState(State):
     """State for editing cells and placing patterns."""
 
+    # D-pad: move cursor by whole cells (first hit wins)
+    _DPAD_MOVES = (
+        (Button.DPAD_UP, 0, -1),
+        (Button.DPAD_DOWN, 0, 1),
+        (Button.DPAD_LEFT, -1, 0),
+        (Button.DPAD_RIGHT, 1, 0),
+    )
+
+    # Arrow keys: move cursor by whole cells
+    _ARROW_MOVES = {
+        pygame.K_UP: (0, -1),
+        pygame.K_DOWN: (0, 1),
+        pygame.K_LEFT: (-1, 0),
+        pygame.K_RIGHT: (1, 0),
+    }
+
     @property
     def name(self) -> str:
         return "editor"
 
     def __init__(self, game):
         super().__init__(game)
-        self.pattern_browser: Optional[PatternBrowser] = None
+        self.pattern_browser: Optional['PatternBrowser'] = None
         self.showing_patterns = False
-        self.zoom_cooldown = 0.0
+        self.zoom_repeat = AxisRepeat()
+
+        # Editor view is static between inputs: reuse the last composed frame
+        self._dirty = True
+        self._frame_cache: Optional[pygame.Surface] = None
+        self._frame_key: Optional[tuple] = None  # Key of the frame held in _frame_cache
+        self._drawn_key: Optional[tuple] = None  # Key of the last fully rendered frame
+
+        # Keyboard dispatch for editor mode (handlers may return a state name)
+        self._editor_keymap = {
+            pygame.K_ESCAPE: lambda: "paused",
+            pygame.K_RETURN: self._place_or_toggle,
+            pygame.K_SPACE: self._place_or_toggle,
+            pygame.K_r: self.game.editor.rotate_pattern,
+            pygame.K_p: self._open_pattern_browser,
+            pygame.K_DELETE: self._clear_cell,
+            pygame.K_BACKSPACE: self._clear_cell,
+            pygame.K_c: self._clear_pattern,
+            pygame.K_PAGEUP: self._zoom_in,
+            pygame.K_PAGEDOWN: self._zoom_out,
+            pygame.K_LEFTBRACKET: self._prev_pattern,
+            pygame.K_RIGHTBRACKET: self._next_pattern,
+            pygame.K_t: self._cycle_theme,
+        }
 
     def enter(self, prev_state=None):
         # Center cursor on viewport
         self.game.editor.center_on_viewport(self.game.viewport)
         self.showing_patterns = False
+        self._dirty = True
 
     def exit(self, next_state=None):
         self.showing_patterns = False
@@ -33,6 +75,8 @@ class EditorState(State):
 
     def _build_pattern_browser(self):
         """Build pattern browser menu."""
+        from ui.menu import PatternBrowser
+
         patterns = [PatternLoader.get_builtin(name)
                    for name in PatternLoader.list_builtin()]
         patterns = [p for p in patterns if p is not None]
@@ -64,14 +108,39 @@ class EditorState(State):
         self.pattern_browser.hide()
         return None
 
+    def _open_pattern_browser(self):
+        """Build and show the pattern browser."""
+        self._build_pattern_browser()
+        self.pattern_browser.show()
+        self.showing_patterns = True
+
+    def _clear_cell(self):
+        """Clear the cell under the cursor."""
+        cx, cy = self.game.editor.cursor_cell
+        self.game.grid.set_cell(cx, cy, False)
+        self._dirty = True
+
+    def _clear_pattern(self):
+        """Return to single cell mode."""
+        self.game.editor.set_pattern(None)
+
+    def _zoom_in(self):
+        """Zoom the viewport in."""
+        self.game.viewport.zoom_in()
+
+    def _zoom_out(self):
+        """Zoom the viewport out."""
+        self.game.viewport.zoom_out()
+
+    def _cycle_theme(self):
+        """Cycle theme and show notification."""
+        theme_name = self.game.renderer.cycle_theme()
+        self.game.hud.notify_theme_change(theme_name)
+
     def update(self, dt: float):
         # Update controller state
         self.game.controller.update()
 
-        # Tick cooldowns
-        if self.zoom_cooldown > 0:
-            self.zoom_cooldown -= dt
-
         # Update HUD timers
         self.game.hud.update(dt)
 
@@ -112,8 +181,7 @@ class EditorState(State):
 
         # X button: Clear cell
         if ctrl.just_pressed(Button.X):
-            cx, cy = editor.cursor_cell
-            self.game.grid.set_cell(cx, cy, False)
+            self._clear_cell()
 
         # Y button: Rotate pattern
         if ctrl.just_pressed(Button.Y):
@@ -121,9 +189,7 @@ class EditorState(State):
 
         # Select: Open pattern browser
         if ctrl.just_pressed(Button.SELECT):
-            self._build_pattern_browser()
-            self.pattern_browser.show()
-            self.showing_patterns = True
+            self._open_pattern_browser()
 
         # Start: Exit editor and run
         if ctrl.just_pressed(Button.START):
@@ -131,34 +197,27 @@ class EditorState(State):
             return
 
         # D-pad: Move cursor by cells
-        if ctrl.just_pressed(Button.DPAD_UP):
-            editor.move_cursor_cells(0, -1)
-        elif ctrl.just_pressed(Button.DPAD_DOWN):
-            editor.move_cursor_cells(0, 1)
-        elif ctrl.just_pressed(Button.DPAD_LEFT):
-            editor.move_cursor_cells(-1, 0)
-        elif ctrl.just_pressed(Button.DPAD_RIGHT):
-            editor.move_cursor_cells(1, 0)
+        for button, dx, dy in self._DPAD_MOVES:
+            if ctrl.just_pressed(button):
+                editor.move_cursor_cells(dx, dy)
+                break
 
         # Left stick: Smooth cursor movement
         lx, ly = ctrl.get_left_stick()
         if lx != 0 or ly != 0:
             editor.move_cursor(lx * 3, ly * 3)
 
-        # Right stick: Zoom (with cooldown)
+        # Right stick: Zoom (instant on push, repeats while held)
         rx, ry = ctrl.get_right_stick()
-        if self.zoom_cooldown <= 0:
-            if ry < -0.5:
-                self.game.viewport.zoom_in()
-                self.zoom_cooldown = 0.3
-            elif ry > 0.5:
-                self.game.viewport.zoom_out()
-                self.zoom_cooldown = 0.3
+        zoom = self.zoom_repeat.update(ry)
+        if zoom < 0:
+            self.game.viewport.zoom_in()
+        elif zoom > 0:
+            self.game.viewport.zoom_out()
 
         # L3: Cycle theme
         if ctrl.just_pressed(Button.L3):
-            theme_name = self.game.renderer.cycle_theme()
-            self.game.hud.notify_theme_change(theme_name)
+            self._cycle_theme()
 
         # L/R: Prev/Next pattern
         if ctrl.just_pressed(Button.L):
@@ -185,6 +244,7 @@ class EditorState(State):
         else:
             # Toggle single cell
             self.game.grid.toggle_cell(cx, cy)
+        self._dirty = True
 
     def _prev_pattern(self):
         """Select previous pattern in library."""
@@ -225,7 +285,33 @@ class EditorState(State):
                     return
             self.game.editor.set_pattern(patterns[0])
 
+    def _render_key(self) -> tuple:
+        """Snapshot of the view state that affects the rendered frame."""
+        editor = self.game.editor
+        viewport = self.game.viewport
+        renderer = self.game.renderer
+        hud = self.game.hud
+        browser = self.pattern_browser
+        return (
+            editor.cursor_cell, id(editor.current_pattern), editor.pattern_rotation,
+            viewport.x, viewport.y, viewport.zoom_index,
+            id(renderer.theme), renderer.show_grid_lines,
+            hud.visible, hud.show_hints, hud.theme_notification,
+            self.game.controller.connected,
+            self.showing_patterns, browser.selected_index if browser else -1,
+        )
+
     def render(self):
+        renderer = self.game.renderer
+        key = self._render_key()
+
+        # Nothing changed: present the cached frame (theme notification fades)
+        still = not self._dirty and not self.game.hud.theme_notification
+        if still and key == self._frame_key:
+            renderer.screen.blit(self._frame_cache, (0, 0))
+            renderer.flip()
+            return
+
         self.game.renderer.clear()
         self.game.renderer.render_grid(self.game.grid, self.game.viewport)
 
@@ -289,6 +375,19 @@ class EditorState(State):
             )
             self.pattern_browser.render(self.game.renderer)
 
+        # Snapshot once the view has held still for a frame, into a reused
+        # surface; before flip() so effects are applied once per presented frame
+        if still and key == self._drawn_key:
+            screen = renderer.screen
+            if self._frame_cache is None or self._frame_cache.get_size() != screen.get_size():
+                self._frame_cache = pygame.Surface(screen.get_size(), 0, screen)
+            self._frame_cache.blit(screen, (0, 0))
+            self._frame_key = key
+        else:
+            self._frame_key = None
+        self._drawn_key = key
+        self._dirty = False
+
         self.game.renderer.flip()
 
     def handle_event(self, event) -> Optional[str]:
@@ -314,40 +413,13 @@ class EditorState(State):
 
     def _handle_editor_event(self, event) -> Optional[str]:
         """Handle events in editor mode."""
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                return "paused"
-            elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                self._place_or_toggle()
-            elif event.key == pygame.K_r:
-                self.game.editor.rotate_pattern()
-            elif event.key == pygame.K_p:
-                self._build_pattern_browser()
-                self.pattern_browser.show()
-                self.showing_patterns = True
-            elif event.key == pygame.K_DELETE or event.key == pygame.K_BACKSPACE:
-                cx, cy = self.game.editor.cursor_cell
-                self.game.grid.set_cell(cx, cy, False)
-            elif event.key == pygame.K_c:
-                self.game.editor.set_pattern(None)  # Clear pattern
-            elif event.key == pygame.K_PAGEUP:
-                self.game.viewport.zoom_in()
-            elif event.key == pygame.K_PAGEDOWN:
-                self.game.viewport.zoom_out()
-            elif event.key == pygame.K_LEFTBRACKET:
-                self._prev_pattern()
-            elif event.key == pygame.K_RIGHTBRACKET:
-                self._next_pattern()
-            elif event.key == pygame.K_UP:
-                self.game.editor.move_cursor_cells(0, -1)
-            elif event.key == pygame.K_DOWN:
-                self.game.editor.move_cursor_cells(0, 1)
-            elif event.key == pygame.K_LEFT:
-                self.game.editor.move_cursor_cells(-1, 0)
-            elif event.key == pygame.K_RIGHT:
-                self.game.editor.move_cursor_cells(1, 0)
-            elif event.key == pygame.K_t:
-                theme_name = self.game.renderer.cycle_theme()
-                self.game.hud.notify_theme_change(theme_name)
+        if event.type != pygame.KEYDOWN:
+            return None
 
-        return None
+        move = self._ARROW_MOVES.get(event.key)
+        if move:
+            self.game.editor.move_cursor_cells(*move)
+            return None
+
+        handler = self._editor_keymap.get(event.key)
+        return handler() if handler else None
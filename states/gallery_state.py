@@ -20,10 +20,10 @@ class GalleryState(State):
     def __init__(self, game):
         super().__init__(game)
 
-        # Pixel fonts
-        self.font_large = PixelFont(scale=3)
-        self.font_medium = PixelFont(scale=2)
-        self.font_small = PixelFont(scale=1)
+        # Pixel fonts (created on first enter)
+        self.font_large: Optional[PixelFont] = None
+        self.font_medium: Optional[PixelFont] = None
+        self.font_small: Optional[PixelFont] = None
 
         # Pattern cycling
         self.patterns: List[Pattern] = []
@@ -38,6 +38,18 @@ class GalleryState(State):
         self.sim_timer = 0.0
         self.sim_speed = 10  # generations per second
 
+        # Overlay fills, built lazily and rebuilt on theme change
+        self._overlay: Optional[pygame.Surface] = None
+        self._hint_overlay: Optional[pygame.Surface] = None
+
+        # Keyboard dispatch (handlers may return a state name)
+        self._keymap = {
+            pygame.K_ESCAPE: lambda: "menu",
+            pygame.K_b: lambda: "menu",
+            pygame.K_SPACE: self._next_pattern,
+            pygame.K_t: self._cycle_theme,
+        }
+
     @property
     def theme(self):
         """Get current theme from renderer."""
@@ -97,7 +109,26 @@ class GalleryState(State):
         self._load_current_pattern()
         self.timer = 0.0
 
+    def _cycle_theme(self):
+        """Cycle to the next color theme."""
+        self.game.renderer.cycle_theme()
+        self._on_theme_changed()
+
+    def _on_theme_changed(self):
+        """Precompute overlay fills for the current theme."""
+        hud_bg = self.theme.hud_bg
+        screen_w = self.game.renderer.screen_width
+        self._overlay = pygame.Surface((screen_w, 50), pygame.SRCALPHA)
+        self._overlay.fill((*hud_bg, 180))
+        self._hint_overlay = pygame.Surface((screen_w, 30), pygame.SRCALPHA)
+        self._hint_overlay.fill((*hud_bg, 150))
+
     def enter(self, prev_state=None):
+        if self.font_medium is None:
+            self.font_large = PixelFont(scale=3)
+            self.font_medium = PixelFont(scale=2)
+            self.font_small = PixelFont(scale=1)
+        self._on_theme_changed()
         self.elapsed = 0.0
         self.timer = 0.0
         self.current_index = 0
@@ -164,11 +195,8 @@ class GalleryState(State):
         pattern = self.patterns[self.current_index]
 
         # Semi-transparent background for text at top
-        overlay_height = 50
-        overlay = pygame.Surface((screen_w, overlay_height), pygame.SRCALPHA)
-        bg = self.theme.hud_bg
-        overlay.fill((bg[0], bg[1], bg[2], 180))
-        screen.blit(overlay, (0, 0))
+        overlay_height = self._overlay.get_height()
+        screen.blit(self._overlay, (0, 0))
 
         # Pattern name
         name_text = self.font_medium.render(pattern.name.upper(), self.theme.title)
@@ -190,23 +218,15 @@ class GalleryState(State):
         pygame.draw.rect(screen, self.theme.cell_alive, (0, bar_y, bar_width, 3))
 
         # Hint at bottom of screen
-        hint_overlay = pygame.Surface((screen_w, 30), pygame.SRCALPHA)
-        hint_overlay.fill((bg[0], bg[1], bg[2], 150))
-        screen.blit(hint_overlay, (0, screen_h - 30))
+        screen.blit(self._hint_overlay, (0, screen_h - 30))
 
         hint = self.font_small.render("A: SKIP  |  B: EXIT  |  T: THEME", self.theme.text_dim)
         hint_rect = hint.get_rect(center=(screen_w // 2, screen_h - 15))
         screen.blit(hint, hint_rect)
 
     def handle_event(self, event) -> Optional[str]:
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                return "menu"
-            elif event.key == pygame.K_SPACE:
-                self._next_pattern()
-            elif event.key == pygame.K_b:
-                return "menu"
-            elif event.key == pygame.K_t:
-                self.game.renderer.cycle_theme()
-
-        return None
+        if event.type != pygame.KEYDOWN:
+            return None
+
+        handler = self._keymap.get(event.key)
+        return handler() if handler else None
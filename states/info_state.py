@@ -1,14 +1,82 @@
 """Information state displaying Game of Life rules with demonstrations."""
 import pygame
 import numpy as np
-import random
-import math
-from typing import Optional, List, Tuple
+from collections import deque
+from typing import Callable, Optional, List, Tuple, Set, Deque, Dict
 from .state_machine import State
 from display.pixelfont import PixelFont
 from input.controller import Button
 import config
 
+# Number of past demo states remembered for loop detection
+HISTORY_SIZE = 100
+
+# Upper bound on precomputed demo frames
+MAX_TAPE_FRAMES = 200
+
+# Pixel size of one cell in the demo grids
+DEMO_CELL_SIZE = 20
+
+
+def _pack_rows(cells: np.ndarray) -> List[int]:
+    """Pack each row of a bool grid into an int (bit j = column j)."""
+    packed = np.packbits(cells, axis=1, bitorder='little')
+    return [int.from_bytes(row.tobytes(), 'little') for row in packed]
+
+
+def _unpack_rows(rows: List[int], w: int) -> np.ndarray:
+    """Inverse of _pack_rows."""
+    nbytes = (w + 7) // 8
+    packed = np.frombuffer(b''.join(r.to_bytes(nbytes, 'little') for r in rows),
+                           dtype=np.uint8).reshape(len(rows), nbytes)
+    return np.unpackbits(packed, axis=1, count=w, bitorder='little').astype(bool)
+
+
+def _life_step_swar(rows: List[int], mask: int) -> List[int]:
+    """
+    Advance bit-packed rows one B3/S23 generation with bitwise adders.
+
+    Each neighbor count is kept as bitplanes: the three cells above and below
+    go through a full adder, the left/right pair through a half adder, and the
+    twos planes are then tested for "exactly one set" (count of 2 or 3).
+
+    Args:
+        rows: One int per row, bit j = column j
+        mask: (1 << width) - 1, clears bits shifted past the right edge
+    """
+    h = len(rows)
+    out = []
+    above = 0
+    for i in range(h):
+        mid = rows[i]
+        below = rows[i + 1] if i + 1 < h else 0
+
+        # Full adders over (left, center, right) of the rows above and below
+        l, r = (above << 1) & mask, above >> 1
+        x = l ^ r
+        t1, t2 = x ^ above, (l & r) | (x & above)
+        l, r = (below << 1) & mask, below >> 1
+        x = l ^ r
+        u1, u2 = x ^ below, (l & r) | (x & below)
+
+        # Half adder over the left/right neighbors in this row
+        l, r = (mid << 1) & mask, mid >> 1
+        m1, m2 = l ^ r, l & r
+
+        # Sum the ones planes; the carry joins the twos planes
+        x = t1 ^ u1
+        ones = x ^ m1
+        carry = (t1 & u1) | (x & m1)
+
+        # Count is 2 or 3 when exactly one twos-weight bit is set
+        p, q = t2 ^ u2, m2 ^ carry
+        one_two = (p ^ q) & ~((t2 & u2) | (m2 & carry) | (p & q))
+
+        # Birth on 3 (ones set), survival on 2 or 3
+        out.append(one_two & (ones | mid))
+        above = mid
+    return out
+
 
 class PatternDemo:
     """A mini simulation demonstrating a Game of Life pattern or rule."""
@@ -24,55 +92,85 @@ class PatternDemo:
             highlight_cell: Optional cell to highlight (for rules page)
             max_frames: Max frames before reset (0 = run forever until stable/loop detected)
         """
-        self.initial_state = initial_state.copy()
-        self.cells = initial_state.copy()
+        self.initial_state = initial_state.astype(bool)  # Alive mask, no uint8 casts
         self.name = name
         self.desc = desc
         self.highlight = highlight_cell
         self.max_frames = max_frames
+
+        # Demos are deterministic: simulate once, then replay the frames
+        self._tape: List[np.ndarray] = self._record_tape()
         self.frame = 0
-        self.history: List[bytes] = []  # For loop detection
+        self.cells = self._tape[0]
+
+        # Rendered label and grid surfaces (owned by InfoState, rebuilt on theme change)
+        self.name_surf: Optional[pygame.Surface] = None
+        self.desc_surf: Optional[pygame.Surface] = None
+        self._surface_cache: Dict[int, pygame.Surface] = {}
+
+    @staticmethod
+    def _fingerprint(cells: np.ndarray) -> int:
+        """Pack cells one bit each into an int for cheap hashing and storage."""
+        return int.from_bytes(np.packbits(cells.ravel()).tobytes(), 'little')
+
+    def _record_tape(self) -> List[np.ndarray]:
+        """Simulate until the demo would reset; returns every displayed frame."""
+        cells = self.initial_state.copy()
+        tape = [cells]
+
+        # Step as bit-packed rows (Python ints, so any width fits)
+        w = cells.shape[1]
+        rows = _pack_rows(cells)
+        mask = (1 << w) - 1
+
+        # Loop detection: set for O(1) lookup, deque for FIFO eviction
+        history_set: Set[int] = set()
+        history_order: Deque[int] = deque(maxlen=HISTORY_SIZE)
+
+        while len(tape) < MAX_TAPE_FRAMES:
+            # Stop at the frame limit
+            if self.max_frames > 0 and len(tape) >= self.max_frames:
+                break
+
+            # Stop once a state repeats (it has already been shown once)
+            fp = self._fingerprint(cells)
+            if fp in history_set:
+                break
+
+            # Keep history bounded (deque drops the oldest entry on append)
+            if len(history_order) == HISTORY_SIZE:
+                history_set.discard(history_order[0])
+            history_order.append(fp)
+            history_set.add(fp)
+
+            rows = _life_step_swar(rows, mask)
+            next_cells = _unpack_rows(rows, w)
+            tape.append(next_cells)
+            cells = next_cells
+
+        return tape
+
+    def frame_surface(self, build: Callable[['PatternDemo'], pygame.Surface]) -> pygame.Surface:
+        """Get the rendered surface for the current frame, building it on first use."""
+        surface = self._surface_cache.get(self.frame)
+        if surface is None:
+            surface = build(self)
+            self._surface_cache[self.frame] = surface
+        return surface
+
+    def clear_surface_cache(self):
+        """Drop rendered frame surfaces (e.g. after a theme change)."""
+        self._surface_cache.clear()
 
     def reset(self):
         """Reset to initial state."""
-        self.cells = self.initial_state.copy()
         self.frame = 0
-        self.history = []
+        self.cells = self._tape[0]
 
     def step(self):
-        """Advance one generation."""
-        # Check if we should reset
-        if self.max_frames > 0 and self.frame >= self.max_frames - 1:
-            self.reset()
-            return
-
-        # Store state for loop detection
-        state_bytes = self.cells.tobytes()
-        if state_bytes in self.history:
-            # We've seen this state before - reset
-            self.reset()
-            return
-        self.history.append(state_bytes)
-
-        # Keep history bounded
-        if len(self.history) > 100:
-            self.history.pop(0)
-
-        h, w = self.cells.shape
-        # Count neighbors
-        padded = np.pad(self.cells, 1, mode='constant', constant_values=0)
-        neighbors = np.zeros_like(self.cells)
-        for dy in [-1, 0, 1]:
-            for dx in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                neighbors += padded[1+dy:1+dy+h, 1+dx:1+dx+w]
-
-        # Apply rules
-        birth = (self.cells == 0) & (neighbors == 3)
-        survive = (self.cells == 1) & ((neighbors == 2) | (neighbors == 3))
-        self.cells = (birth | survive).astype(np.uint8)
-        self.frame += 1
+        """Advance one generation (wraps to the start after the last frame)."""
+        self.frame = (self.frame + 1) % len(self._tape)
+        self.cells = self._tape[self.frame]
 
 
 class InfoState(State):
@@ -91,7 +189,6 @@ class InfoState(State):
         self.font_small = PixelFont(scale=1)
 
         # Animated stars background
-        self.stars: List[List] = []
         self._init_stars()
 
         # Animation timers
@@ -99,6 +196,11 @@ class InfoState(State):
         self.step_timer = 0.0
         self.step_interval = 1.0  # Seconds between steps
 
+        # Stars animate at a capped rate; other changes force an immediate frame
+        self._star_fps = 30.0
+        self._star_accum = 0.0
+        self._need_full_redraw = True
+
         # Pages
         self.current_page = 0
         self.page_titles = ["THE FOUR RULES", "PATTERN TYPES"]
@@ -107,11 +209,50 @@ class InfoState(State):
             self._create_pattern_demos(),
         ]
 
+        # Theme the cached demo surfaces were drawn with
+        self._cached_theme = None
+        self._empty_grid_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+
+        # Static UI layer (title, demos, labels), keyed by theme/page/demo frames
+        self._ui_cache: Optional[pygame.Surface] = None
+        self._ui_cache_key: Optional[tuple] = None
+
+        # Pre-rendered text
+        self._title_surfs: List[pygame.Surface] = []
+        self._page_surfs: List[pygame.Surface] = []
+        self._hint_surf: Optional[pygame.Surface] = None
+        self._on_theme_changed()
+
     @property
     def theme(self):
         """Get current theme from renderer."""
         return self.game.renderer.theme
 
+    def _on_theme_changed(self):
+        """Re-render cached text and drop surfaces drawn with the old theme."""
+        theme = self.theme
+        self._cached_theme = theme
+        self._need_full_redraw = True
+        self._empty_grid_cache.clear()
+
+        self._title_surfs = [
+            self.font_large.render_with_shadow(title, theme.title, theme.title_shadow, 2)
+            for title in self.page_titles
+        ]
+        self._page_surfs = [
+            self.font_small.render(f"PAGE {i + 1}/{len(self.page_demos)}", theme.text_dim)
+            for i in range(len(self.page_demos))
+        ]
+        self._hint_surf = self.font_small.render(
+            "LEFT/RIGHT: FLIP PAGE  |  B: BACK", theme.text_dim
+        )
+
+        for page_demos in self.page_demos:
+            for demo in page_demos:
+                demo.name_surf = self.font_medium.render(demo.name, theme.subtitle)
+                demo.desc_surf = self.font_small.render(demo.desc, theme.text)
+                demo.clear_surface_cache()
+
     def _create_rule_demos(self) -> List[PatternDemo]:
         """Create the 4 rule demonstration grids."""
         demos = []
@@ -221,18 +362,18 @@ class InfoState(State):
         return demos
 
     def _init_stars(self):
-        """Initialize twinkling stars background."""
-        self.stars = []
+        """Initialize twinkling stars background (one array per attribute)."""
+        count = 80
         screen_w = config.SCREEN_WIDTH
         screen_h = config.SCREEN_HEIGHT
 
-        for _ in range(80):
-            x = random.randint(0, screen_w)
-            y = random.randint(0, screen_h)
-            brightness = random.uniform(0.2, 1.0)
-            speed = random.uniform(0.5, 2.0)
-            phase = random.uniform(0, 6.28)
-            self.stars.append([x, y, brightness, speed, phase])
+        self.star_x = np.random.randint(0, screen_w + 1, count)
+        self.star_y = np.random.randint(0, screen_h + 1, count)
+        self.star_base = np.random.uniform(0.2, 1.0, count)
+        self.star_speed = np.random.uniform(0.5, 2.0, count)
+        self.star_phase = np.random.uniform(0, 6.28, count)
+        # Color is picked once per star so stars don't flicker between colors
+        self.star_secondary_mask = np.random.random(count) > 0.7
 
     def enter(self, prev_state=None):
         self.elapsed = 0.0
@@ -241,6 +382,7 @@ class InfoState(State):
         for page_demos in self.page_demos:
             for demo in page_demos:
                 demo.reset()
+        self._need_full_redraw = True
 
     def exit(self, next_state=None):
         pass
@@ -252,6 +394,7 @@ class InfoState(State):
         for demo in self.page_demos[self.current_page]:
             demo.reset()
         self.step_timer = 0.0
+        self._need_full_redraw = True
 
     def _prev_page(self):
         """Go to previous page."""
@@ -260,16 +403,19 @@ class InfoState(State):
         for demo in self.page_demos[self.current_page]:
             demo.reset()
         self.step_timer = 0.0
+        self._need_full_redraw = True
 
     def update(self, dt: float):
         self.elapsed += dt
         self.step_timer += dt
+        self._star_accum += dt
 
         # Step current page demos periodically
         if self.step_timer >= self.step_interval:
             self.step_timer = 0.0
             for demo in self.page_demos[self.current_page]:
                 demo.step()
+            self._need_full_redraw = True
 
         # Update controller state
         self.game.controller.update()
@@ -293,49 +439,87 @@ class InfoState(State):
         screen_w = renderer.screen_width
         screen_h = renderer.screen_height
 
+        # Theme may have been changed from another state
+        if self.theme is not self._cached_theme:
+            self._on_theme_changed()
+
+        # Keep the previous frame until the stars are due or the UI changed
+        star_interval = 1.0 / self._star_fps
+        if not self._need_full_redraw and self._star_accum < star_interval:
+            return
+        self._star_accum %= star_interval
+        self._need_full_redraw = False
+
+        # Rebuild the static layer only when something on it changed
+        demos = self.page_demos[self.current_page]
+        key = (id(self.theme), self.current_page, tuple(d.frame for d in demos))
+        if key != self._ui_cache_key:
+            self._render_ui_layer(screen_w, screen_h)
+            self._ui_cache_key = key
+
         # Dark background
         screen.fill(self.theme.screen_bg)
 
         # Draw twinkling stars
         self._draw_stars(screen)
 
+        # Title, demos, page indicator and hint
+        screen.blit(self._ui_cache, (0, 0))
+
+        renderer.flip()
+
+    def _render_ui_layer(self, screen_w: int, screen_h: int):
+        """Draw everything except background and stars onto a transparent layer."""
+        if self._ui_cache is None:
+            self._ui_cache = pygame.Surface((screen_w, screen_h), pygame.SRCALPHA)
+        layer = self._ui_cache
+        layer.fill((0, 0, 0, 0))
+
         # Draw title
-        title = self.font_large.render_with_shadow(
-            self.page_titles[self.current_page], self.theme.title, self.theme.title_shadow, 2
-        )
+        title = self._title_surfs[self.current_page]
         title_rect = title.get_rect(center=(screen_w // 2, 30))
-        screen.blit(title, title_rect)
+        layer.blit(title, title_rect)
 
         # Draw 2x2 grid of demos
-        self._render_demos(screen, screen_w, screen_h)
+        self._render_demos(layer, screen_w, screen_h)
 
         # Draw page indicator
-        page_text = f"PAGE {self.current_page + 1}/{len(self.page_demos)}"
-        page_surf = self.font_small.render(page_text, self.theme.text_dim)
-        screen.blit(page_surf, (15, screen_h - 20))
+        layer.blit(self._page_surfs[self.current_page], (15, screen_h - 20))
 
         # Draw navigation hint at bottom
-        hint = self.font_small.render("LEFT/RIGHT: FLIP PAGE  |  B: BACK", self.theme.text_dim)
-        hint_rect = hint.get_rect(center=(screen_w // 2, screen_h - 20))
-        screen.blit(hint, hint_rect)
-
-        renderer.flip()
+        hint_rect = self._hint_surf.get_rect(center=(screen_w // 2, screen_h - 20))
+        layer.blit(self._hint_surf, hint_rect)
 
     def _draw_stars(self, screen: pygame.Surface):
         """Draw twinkling stars background."""
-        for star in self.stars:
-            x, y, base_brightness, speed, phase = star
-            twinkle = (math.sin(self.elapsed * speed + phase) + 1) / 2
-            brightness = base_brightness * (0.3 + 0.7 * twinkle)
-
-            if random.random() > 0.7:
-                base = self.theme.star_secondary
-            else:
-                base = self.theme.star_primary
-            color = (int(base[0] * brightness), int(base[1] * brightness), int(base[2] * brightness))
+        twinkle = (np.sin(self.elapsed * self.star_speed + self.star_phase) + 1) * 0.5
+        brightness = self.star_base * (0.3 + 0.7 * twinkle)
+
+        base = np.where(self.star_secondary_mask[:, None],
+                        self.theme.star_secondary, self.theme.star_primary)
+        colors = (base * brightness[:, None]).astype(np.uint8)
+
+        # Bright stars are 2x2, the rest a single pixel
+        big = brightness > 0.7
+        if screen.get_bytesize() not in (1, 2, 4):
+            # pixels2d cannot reference 24-bit surfaces: draw star by star
+            for x, y, color, size in zip(self.star_x.tolist(), self.star_y.tolist(),
+                                         colors.tolist(), np.where(big, 2, 1).tolist()):
+                screen.fill(color, (x, y, size, size))
+            return
 
-            size = 2 if brightness > 0.7 else 1
-            pygame.draw.rect(screen, color, (int(x), int(y), size, size))
+        # Write every star through a pixel array, clipped to the screen
+        mapped = pygame.surfarray.map_array(screen, colors)
+        pixels = pygame.surfarray.pixels2d(screen)
+        w, h = pixels.shape
+        for dx, dy in ((0, 0), (1, 0), (0, 1), (1, 1)):
+            xs = self.star_x + dx
+            ys = self.star_y + dy
+            visible = (xs < w) & (ys < h)
+            if dx or dy:
+                visible &= big
+            pixels[xs[visible], ys[visible]] = mapped[visible]
+        del pixels  # Unlock the surface
 
     def _render_demos(self, screen: pygame.Surface, screen_w: int, screen_h: int):
         """Render the 2x2 grid of demonstrations."""
@@ -362,17 +546,17 @@ class InfoState(State):
                      qx: int, qy: int, qw: int, qh: int):
         """Render a single demonstration in its quadrant."""
         # Draw name
-        name_surf = self.font_medium.render(demo.name, self.theme.subtitle)
+        name_surf = demo.name_surf
         name_rect = name_surf.get_rect(center=(qx + qw // 2, qy + 15))
         screen.blit(name_surf, name_rect)
 
         # Draw description
-        desc_surf = self.font_small.render(demo.desc, self.theme.text)
+        desc_surf = demo.desc_surf
         desc_rect = desc_surf.get_rect(center=(qx + qw // 2, qy + 35))
         screen.blit(desc_surf, desc_rect)
 
         # Draw the mini grid
-        cell_size = 20
+        cell_size = DEMO_CELL_SIZE
         grid_h, grid_w = demo.cells.shape
         grid_pixel_w = grid_w * cell_size
         grid_pixel_h = grid_h * cell_size
@@ -381,36 +565,57 @@ class InfoState(State):
         grid_x = qx + (qw - grid_pixel_w) // 2
         grid_y = qy + 50 + (qh - 70 - grid_pixel_h) // 2
 
-        # Draw grid background
-        pygame.draw.rect(screen, self.theme.menu_bg,
-                        (grid_x - 2, grid_y - 2, grid_pixel_w + 4, grid_pixel_h + 4))
-
-        # Draw cells
-        for row in range(grid_h):
-            for col in range(grid_w):
-                cx = grid_x + col * cell_size
-                cy = grid_y + row * cell_size
-
-                is_highlight = demo.highlight and (row == demo.highlight[0] and col == demo.highlight[1])
-                is_alive = demo.cells[row, col]
-
-                if is_highlight:
-                    # Draw highlight border
-                    pygame.draw.rect(screen, self.theme.cursor,
-                                   (cx, cy, cell_size, cell_size), 2)
-                    if is_alive:
-                        pygame.draw.rect(screen, self.theme.cursor,
-                                       (cx + 3, cy + 3, cell_size - 6, cell_size - 6))
-                    else:
-                        pygame.draw.rect(screen, self.theme.text_dim,
-                                       (cx + 3, cy + 3, cell_size - 6, cell_size - 6))
-                elif is_alive:
-                    pygame.draw.rect(screen, self.theme.cell_alive,
-                                   (cx + 2, cy + 2, cell_size - 4, cell_size - 4))
-                else:
-                    # Empty cell - just draw faint grid
-                    pygame.draw.rect(screen, self.theme.grid_lines,
-                                   (cx, cy, cell_size, cell_size), 1)
+        grid_surf = demo.frame_surface(self._build_demo_surface)
+        screen.blit(grid_surf, (grid_x - 2, grid_y - 2))
+
+    def _build_demo_surface(self, demo: PatternDemo) -> pygame.Surface:
+        """Draw a demo's current frame, with its 2px background border."""
+        theme = self.theme
+        cursor = theme.cursor
+        cell_alive = theme.cell_alive
+        text_dim = theme.text_dim
+        bg = theme.menu_bg
+        cell_size = DEMO_CELL_SIZE
+
+        # Start from the empty grid and only redraw the cells that differ
+        surface = self._empty_demo_grid(demo.cells.shape).copy()
+        for row, col in np.argwhere(demo.cells):
+            if (row, col) == demo.highlight:
+                continue
+            cx = 2 + col * cell_size
+            cy = 2 + row * cell_size
+            surface.fill(bg, (cx, cy, cell_size, cell_size))
+            surface.fill(cell_alive, (cx + 2, cy + 2, cell_size - 4, cell_size - 4))
+
+        if demo.highlight:
+            row, col = demo.highlight
+            cx = 2 + col * cell_size
+            cy = 2 + row * cell_size
+            surface.fill(bg, (cx, cy, cell_size, cell_size))
+            pygame.draw.rect(surface, cursor, (cx, cy, cell_size, cell_size), 2)
+            inner = cursor if demo.cells[row, col] else text_dim
+            surface.fill(inner, (cx + 3, cy + 3, cell_size - 6, cell_size - 6))
+
+        return surface
+
+    def _empty_demo_grid(self, shape: Tuple[int, int]) -> pygame.Surface:
+        """Background plus faint cell outlines for a demo grid, cached per shape."""
+        surface = self._empty_grid_cache.get(shape)
+        if surface is None:
+            theme = self.theme
+            grid_lines = theme.grid_lines
+            cell_size = DEMO_CELL_SIZE
+            grid_h, grid_w = shape
+
+            surface = pygame.Surface((grid_w * cell_size + 4, grid_h * cell_size + 4))
+            surface.fill(theme.menu_bg)
+            for row in range(grid_h):
+                for col in range(grid_w):
+                    pygame.draw.rect(surface, grid_lines,
+                                     (2 + col * cell_size, 2 + row * cell_size,
+                                      cell_size, cell_size), 1)
+            self._empty_grid_cache[shape] = surface
+        return surface
 
     def handle_event(self, event) -> Optional[str]:
         if event.type == pygame.KEYDOWN:
@@ -422,5 +627,6 @@ class InfoState(State):
                 self._prev_page()
             elif event.key == pygame.K_t:
                 self.game.renderer.cycle_theme()
+                self._on_theme_changed()
 
         return None
@@ -1,14 +1,23 @@
 """Menu state for main menu and submenus."""
+import os
 import pygame
-import random
-from typing import Optional, List
+import numpy as np
+from collections import OrderedDict
+from typing import Optional, List, Dict, Tuple
 from .state_machine import State
 from ui.menu import Menu, MenuItem, PatternBrowser
-from engine.patterns import PatternLoader
+from engine.patterns import Pattern, PatternLoader
 from display.themes import THEMES
 from display.pixelfont import PixelFont
+from input.controller import Button, Axis
 import config
 
+# Brightness levels pre-rendered per star color
+STAR_LEVELS = 8
+
+# Number of pattern previews kept for quick back-and-forth browsing
+PREVIEW_CACHE_SIZE = 8
+
 
 class MenuState(State):
     """Main menu state."""
@@ -24,6 +33,10 @@ class MenuState(State):
         self.main_menu: Optional[Menu] = None
         self.pattern_browser: Optional[PatternBrowser] = None
 
+        # Merged pattern list, reloaded when a pattern directory changes
+        self._pattern_cache: Optional[List[Pattern]] = None
+        self._pattern_cache_mtime: Tuple[float, float] = (0.0, 0.0)
+
         # Pagination settings for pattern browser
         self.items_per_page = 8
         self.current_page = 0
@@ -33,36 +46,117 @@ class MenuState(State):
         self.font_medium = PixelFont(scale=2)
         self.font_small = PixelFont(scale=1)  # Smaller for descriptions
 
+        # Title, items, description and preview, keyed by theme/menu/selection/page
+        self._menu_layer: Optional[pygame.Surface] = None
+        self._menu_layer_key: Optional[tuple] = None
+
+        # Renderer capabilities don't change at runtime
+        self._has_effects = hasattr(self.game.renderer, 'effects')
+
+        # Theme order, and the position of the current theme in it
+        self._theme_names = tuple(THEMES.keys())
+        self._theme_idx = self._find_theme_index()
+
+        # Upper-cased menu strings (the pixel font only has capitals)
+        self._upper_cache: Dict[str, str] = {}
+
+        # Rendered text surfaces keyed by (text, color, scale, shadow color)
+        self._text_cache: Dict[Tuple[str, tuple, int, Optional[tuple]], pygame.Surface] = {}
+
+        # Recently shown pattern previews keyed by (name, cell color), oldest first
+        self._preview_lru: OrderedDict = OrderedDict()
+        self._preview_bg_surf: Optional[pygame.Surface] = None
+        self._preview_bg_key: Optional[tuple] = None
+
         # Stick navigation cooldown
         self.stick_nav_cooldown = 0.0
 
         # Animated stars background
-        self.stars: List[List] = []  # [x, y, brightness, speed]
         self._init_stars()
 
         # Animation timer
         self.elapsed = 0.0
 
         self._build_menus()
+        self._build_action_map()
 
     @property
     def theme(self):
         """Get current theme from renderer."""
         return self.game.renderer.theme
 
+    def _cached_render(self, text: str, color: Tuple[int, int, int], font: PixelFont,
+                       shadow: Optional[Tuple[int, int, int]] = None) -> pygame.Surface:
+        """Render text through the cache (with a 2px drop shadow if shadow is given)."""
+        key = (text, color, font.scale, shadow)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if shadow is None:
+                surface = font.render(text, color)
+            else:
+                surface = font.render_with_shadow(text, color, shadow, 2)
+            self._text_cache[key] = surface
+        return surface
+
+    def _upper(self, text: str) -> str:
+        """Upper-case a menu string once and reuse it."""
+        upper = self._upper_cache.get(text)
+        if upper is None:
+            upper = self._upper_cache[text] = text.upper()
+        return upper
+
+    def _prewarm_text(self, menu: Menu):
+        """Render a menu's title and item labels in both label colors."""
+        theme = self.theme
+        self._cached_render(self._upper(menu.title), theme.title, self.font_large,
+                            theme.title_shadow)
+        for item in menu.items:
+            self._upper(item.description)
+            label = self._upper(item.label)
+            for color in (theme.text, theme.text_highlight):
+                self._cached_render(label, color, self.font_medium)
+
     def _init_stars(self):
-        """Initialize twinkling stars background."""
-        self.stars = []
+        """Initialize twinkling stars background (one array per attribute)."""
+        count = 80
         screen_w = config.SCREEN_WIDTH
         screen_h = config.SCREEN_HEIGHT
 
-        for _ in range(80):
-            x = random.randint(0, screen_w)
-            y = random.randint(0, screen_h)
-            brightness = random.uniform(0.2, 1.0)
-            speed = random.uniform(0.5, 2.0)  # Twinkle speed
-            phase = random.uniform(0, 6.28)   # Random phase offset
-            self.stars.append([x, y, brightness, speed, phase])
+        self.star_x = np.random.randint(0, screen_w + 1, count, dtype=np.int32)
+        self.star_y = np.random.randint(0, screen_h + 1, count, dtype=np.int32)
+        self.star_base = np.random.uniform(0.2, 1.0, count).astype(np.float32)
+        self.star_speed = np.random.uniform(0.5, 2.0, count).astype(np.float32)  # Twinkle speed
+        self.star_phase = np.random.uniform(0, 6.28, count).astype(np.float32)   # Random phase offset
+        # Color is picked once per star so stars don't flicker between colors
+        self.star_secondary_mask = np.random.random(count) > 0.7
+
+        # Stars placed on the far edge would never show; don't carry them per frame
+        visible = (self.star_x < screen_w) & (self.star_y < screen_h)
+        if not visible.all():
+            self.star_x = self.star_x[visible]
+            self.star_y = self.star_y[visible]
+            self.star_base = self.star_base[visible]
+            self.star_speed = self.star_speed[visible]
+            self.star_phase = self.star_phase[visible]
+            self.star_secondary_mask = self.star_secondary_mask[visible]
+
+        self._star_positions = list(zip(self.star_x.tolist(), self.star_y.tolist()))
+        self._star_sprites: List[pygame.Surface] = []
+        self._star_sprites_theme = None
+
+    def _build_star_sprites(self):
+        """Pre-render 1px and 2px star sprites for every color and brightness level."""
+        theme = self.theme
+        self._star_sprites = []
+        for base in (theme.star_primary, theme.star_secondary):
+            for level in range(STAR_LEVELS):
+                brightness = (level + 0.5) / STAR_LEVELS
+                color = tuple(int(c * brightness) for c in base)
+                for size in (1, 2):
+                    sprite = pygame.Surface((size, size))
+                    sprite.fill(color)
+                    self._star_sprites.append(sprite)
+        self._star_sprites_theme = theme
 
     def _build_menus(self):
         """Build menu structure."""
@@ -172,8 +266,26 @@ class MenuState(State):
             ),
         ])
 
-    def _build_pattern_browser(self):
-        """Build pattern browser menu."""
+        for menu in (self.main_menu, play_menu, demo_menu, settings_menu):
+            self._prewarm_text(menu)
+
+    @staticmethod
+    def _pattern_dirs_mtime() -> Tuple[float, float]:
+        """Modification times of the pattern directories (0 if missing)."""
+        mtimes = []
+        for directory in (config.BUILTIN_PATTERNS_DIR, config.USER_PATTERNS_DIR):
+            try:
+                mtimes.append(os.stat(directory).st_mtime)
+            except OSError:
+                mtimes.append(0.0)
+        return tuple(mtimes)
+
+    def _load_patterns(self) -> List[Pattern]:
+        """Get builtin and user patterns, rescanning only when a directory changed."""
+        mtime = self._pattern_dirs_mtime()
+        if self._pattern_cache is not None and mtime == self._pattern_cache_mtime:
+            return self._pattern_cache
+
         # Get hardcoded builtin patterns
         patterns = [PatternLoader.get_builtin(name)
                    for name in PatternLoader.list_builtin()]
@@ -194,11 +306,19 @@ class MenuState(State):
                 patterns.append(p)
                 seen.add(key)
 
+        self._pattern_cache = patterns
+        self._pattern_cache_mtime = mtime
+        self._preview_lru.clear()  # Previews are keyed by name; contents may have changed
+        return patterns
+
+    def _build_pattern_browser(self):
+        """Build pattern browser menu."""
         self.pattern_browser = PatternBrowser(
-            patterns,
+            self._load_patterns(),
             on_select=self._select_pattern
         )
         self.pattern_browser.parent = self.main_menu
+        self._prewarm_text(self.pattern_browser)
 
     def _select_pattern(self, pattern):
         """Handle pattern selection."""
@@ -217,18 +337,24 @@ class MenuState(State):
 
         return "running"
 
+    def _find_theme_index(self) -> int:
+        """Position of the renderer's theme in the theme order (0 if unknown)."""
+        for i, name in enumerate(self._theme_names):
+            if THEMES[name] == self.game.renderer.theme:
+                return i
+        return 0
+
     def _cycle_theme(self):
         """Cycle through available themes."""
-        theme_names = list(THEMES.keys())
-        current_idx = 0
+        # Other states can switch themes too; only search when out of sync
+        if THEMES[self._theme_names[self._theme_idx]] is not self.game.renderer.theme:
+            self._theme_idx = self._find_theme_index()
 
-        for i, name in enumerate(theme_names):
-            if THEMES[name] == self.game.renderer.theme:
-                current_idx = i
-                break
+        self._theme_idx = (self._theme_idx + 1) % len(self._theme_names)
+        self.game.renderer.set_theme(self._theme_names[self._theme_idx])
 
-        next_idx = (current_idx + 1) % len(theme_names)
-        self.game.renderer.set_theme(theme_names[next_idx])
+        # Cached text was rendered in the old theme's colors
+        self._text_cache.clear()
         return None
 
     def _toggle_grid_lines(self):
@@ -248,8 +374,9 @@ class MenuState(State):
         self.current_menu = self.main_menu
         self.current_menu.show()
 
-        # Build pattern browser fresh each time
+        # Rebuild the pattern browser (patterns are cached between visits)
         self._build_pattern_browser()
+        self._menu_layer_key = None  # Browser is a new object; redraw the menu layer
 
     def exit(self, next_state=None):
         if self.current_menu:
@@ -267,8 +394,6 @@ class MenuState(State):
             self.stick_nav_cooldown -= dt
 
         # Controller navigation
-        from input.controller import Button, Axis
-
         if self.game.controller.just_pressed(Button.DPAD_UP):
             self.current_menu.navigate_up()
             self._update_page_for_selection()
@@ -298,12 +423,50 @@ class MenuState(State):
                 self._update_page_for_selection()
                 self.stick_nav_cooldown = 0.25
 
+    def idle_timeout(self) -> int:
+        # Only the starfield moves here and it is time-based
+        return config.IDLE_FRAME_MS
+
     def _update_page_for_selection(self):
         """Update current page to show the selected item."""
         if isinstance(self.current_menu, PatternBrowser):
             selected = self.current_menu.selected_index
             self.current_page = selected // self.items_per_page
 
+    def _build_action_map(self):
+        """Map menu action results to their handlers."""
+        self._action_map = {
+            "new_game": self._act_new_game,
+            "random": self._act_random,
+            "patterns": self._act_patterns,
+            "resume": lambda: self.game.state_machine.change_state("running"),
+            "quit": self._act_quit,
+            "back": self._handle_back,
+        }
+        for state in ("running", "info", "gallery", "colophon", "boot"):
+            self._action_map[state] = lambda state=state: self.game.state_machine.change_state(state)
+
+    def _act_new_game(self):
+        """Start with an empty grid."""
+        self.game.grid.clear()
+        self.game.state_machine.change_state("running")
+
+    def _act_random(self):
+        """Start with a randomly filled grid."""
+        self.game.grid.randomize(0.3)
+        self.game.state_machine.change_state("running")
+
+    def _act_patterns(self):
+        """Open the pattern browser."""
+        self.current_menu.hide()
+        self.current_menu = self.pattern_browser
+        self.current_page = 0
+        self.current_menu.show()
+
+    def _act_quit(self):
+        """Exit the game."""
+        self.game.running = False
+
     def _handle_select(self):
         """Handle menu selection."""
         result = self.current_menu.select()
@@ -312,33 +475,10 @@ class MenuState(State):
             self.current_menu.hide()
             self.current_menu = result
             self.current_menu.show()
-        elif result == "new_game":
-            self.game.grid.clear()
-            self.game.state_machine.change_state("running")
-        elif result == "random":
-            self.game.grid.randomize(0.3)
-            self.game.state_machine.change_state("running")
-        elif result == "patterns":
-            self.current_menu.hide()
-            self.current_menu = self.pattern_browser
-            self.current_page = 0
-            self.current_menu.show()
-        elif result == "resume":
-            self.game.state_machine.change_state("running")
-        elif result == "quit":
-            self.game.running = False
-        elif result == "back":
-            self._handle_back()
-        elif result == "running":
-            self.game.state_machine.change_state("running")
-        elif result == "info":
-            self.game.state_machine.change_state("info")
-        elif result == "gallery":
-            self.game.state_machine.change_state("gallery")
-        elif result == "colophon":
-            self.game.state_machine.change_state("colophon")
-        elif result == "boot":
-            self.game.state_machine.change_state("boot")
+        elif isinstance(result, str):
+            handler = self._action_map.get(result)
+            if handler:
+                handler()
 
     def _handle_back(self):
         """Handle back navigation."""
@@ -360,41 +500,47 @@ class MenuState(State):
         # Draw twinkling stars
         self._draw_stars(screen)
 
-        # Render current menu with pixel font
+        # Render current menu with pixel font (cached until it changes)
         if self.current_menu:
-            self._render_pixel_menu(screen, screen_w, screen_h)
+            menu = self.current_menu
+            key = (id(self.theme), id(menu), menu.visible, menu.selected_index,
+                   self.current_page)
+            if key != self._menu_layer_key:
+                if self._menu_layer is None:
+                    self._menu_layer = pygame.Surface((screen_w, screen_h), pygame.SRCALPHA)
+                self._menu_layer.fill((0, 0, 0, 0))
+                self._render_pixel_menu(self._menu_layer, screen_w, screen_h)
+                self._menu_layer_key = key
+            screen.blit(self._menu_layer, (0, 0))
 
         # Apply effects
-        if hasattr(renderer, 'effects'):
-            renderer.effects.apply_scanlines(screen)
-            renderer.effects.apply_vignette(screen)
+        if self._has_effects:
+            renderer.effects.apply_crt(screen)
 
         renderer.flip()
 
     def _draw_stars(self, screen: pygame.Surface):
         """Draw twinkling stars background."""
-        import math
-        for star in self.stars:
-            x, y, base_brightness, speed, phase = star
-            # Calculate twinkling brightness
-            twinkle = (math.sin(self.elapsed * speed + phase) + 1) / 2
-            brightness = base_brightness * (0.3 + 0.7 * twinkle)
-
-            # Use theme star colors
-            if random.random() > 0.7:
-                base = self.theme.star_secondary
-            else:
-                base = self.theme.star_primary
-            color = (int(base[0] * brightness), int(base[1] * brightness), int(base[2] * brightness))
+        if self._star_sprites_theme is not self.theme:
+            self._build_star_sprites()
+
+        twinkle = (np.sin(self.elapsed * self.star_speed + self.star_phase) + 1) * 0.5
+        brightness = self.star_base * (0.3 + 0.7 * twinkle)
+
+        # Sprite index: color, then brightness level, then size (2x2 when bright)
+        level = np.minimum((brightness * STAR_LEVELS).astype(np.intp), STAR_LEVELS - 1)
+        index = (self.star_secondary_mask * STAR_LEVELS + level) * 2 + (brightness > 0.7)
 
-            size = 2 if brightness > 0.7 else 1
-            pygame.draw.rect(screen, color, (int(x), int(y), size, size))
+        sprites = self._star_sprites
+        screen.blits([(sprites[i], pos) for i, pos in zip(index.tolist(), self._star_positions)],
+                     doreturn=False)
 
     def _render_pixel_menu(self, screen: pygame.Surface, screen_w: int, screen_h: int):
         """Render menu with pixel font."""
         menu = self.current_menu
         if not menu or not menu.visible:
             return
+        theme = self.theme
 
         # Check if we're rendering the pattern browser
         if isinstance(menu, PatternBrowser):
@@ -414,11 +560,11 @@ class MenuState(State):
         start_y = (screen_h - content_height) // 2
 
         # Draw title
-        title_surface = self.font_large.render_with_shadow(
-            menu.title.upper(),
-            self.theme.title,
-            self.theme.title_shadow,
-            2
+        title_surface = self._cached_render(
+            self._upper(menu.title),
+            theme.title,
+            self.font_large,
+            theme.title_shadow
         )
         title_rect = title_surface.get_rect(center=(screen_w // 2, start_y + title_height // 2))
         screen.blit(title_surface, title_rect)
@@ -432,24 +578,25 @@ class MenuState(State):
 
             if is_selected:
                 # Draw selection indicator
-                color = self.theme.text_highlight
+                color = theme.text_highlight
                 # Draw arrow
-                arrow = self.font_medium.render(">", self.theme.text_highlight)
+                arrow = self._cached_render(">", theme.text_highlight, self.font_medium)
                 screen.blit(arrow, (screen_w // 2 - 100, y))
             else:
-                color = self.theme.text
+                color = theme.text
 
             # Draw item label
-            label_surface = self.font_medium.render(item.label.upper(), color)
+            label_surface = self._cached_render(self._upper(item.label), color, self.font_medium)
             label_rect = label_surface.get_rect(center=(screen_w // 2, y + 7))
             screen.blit(label_surface, label_rect)
 
         # Draw description for selected item at very bottom
         if menu.selected_item and menu.selected_item.description:
             desc_y = screen_h - 25  # Closer to bottom
-            desc_surface = self.font_small.render(
-                menu.selected_item.description.upper(),
-                self.theme.text_dim
+            desc_surface = self._cached_render(
+                self._upper(menu.selected_item.description),
+                theme.text_dim,
+                self.font_small
             )
             desc_rect = desc_surface.get_rect(center=(screen_w // 2, desc_y))
             screen.blit(desc_surface, desc_rect)
@@ -461,6 +608,7 @@ class MenuState(State):
 
         if not patterns:
             return
+        theme = self.theme
 
         # Layout constants
         title_height = 21
@@ -488,11 +636,11 @@ class MenuState(State):
         start_y = margin_top
 
         # Draw title
-        title_surface = self.font_large.render_with_shadow(
-            menu.title.upper(),
-            self.theme.title,
-            self.theme.title_shadow,
-            2
+        title_surface = self._cached_render(
+            self._upper(menu.title),
+            theme.title,
+            self.font_large,
+            theme.title_shadow
         )
         title_rect = title_surface.get_rect(center=(list_center_x, start_y + title_height // 2))
         screen.blit(title_surface, title_rect)
@@ -506,29 +654,30 @@ class MenuState(State):
             y = items_start_y + i * item_spacing
 
             if is_selected:
-                color = self.theme.text_highlight
-                arrow = self.font_medium.render(">", self.theme.text_highlight)
+                color = theme.text_highlight
+                arrow = self._cached_render(">", theme.text_highlight, self.font_medium)
                 screen.blit(arrow, (list_center_x - 120, y))
             else:
-                color = self.theme.text
+                color = theme.text
 
-            label_surface = self.font_medium.render(item.label.upper(), color)
+            label_surface = self._cached_render(self._upper(item.label), color, self.font_medium)
             label_rect = label_surface.get_rect(center=(list_center_x, y + 7))
             screen.blit(label_surface, label_rect)
 
         # Draw pagination info
         if total_pages > 1:
             page_text = f"PAGE {self.current_page + 1}/{total_pages}"
-            page_surface = self.font_small.render(page_text, self.theme.subtitle)
+            page_surface = self._cached_render(page_text, theme.subtitle, self.font_small)
             page_rect = page_surface.get_rect(center=(list_center_x, screen_h - 50))
             screen.blit(page_surface, page_rect)
 
         # Draw description for selected item
         if menu.selected_item and menu.selected_item.description:
             desc_y = screen_h - 25
-            desc_surface = self.font_small.render(
-                menu.selected_item.description.upper(),
-                self.theme.text_dim
+            desc_surface = self._cached_render(
+                self._upper(menu.selected_item.description),
+                theme.text_dim,
+                self.font_small
             )
             desc_rect = desc_surface.get_rect(center=(list_center_x, desc_y))
             screen.blit(desc_surface, desc_rect)
@@ -544,58 +693,78 @@ class MenuState(State):
             return
 
         pattern = menu.patterns[menu.selected_index]
+        theme = self.theme
 
         # Preview area position
         preview_x = screen_w - preview_width - preview_margin
         preview_y = 80
         preview_box_size = 160
 
-        # Draw preview box background
-        box_surface = pygame.Surface((preview_box_size + 20, preview_box_size + 20), pygame.SRCALPHA)
-        bg = self.theme.menu_bg
-        box_surface.fill((bg[0], bg[1], bg[2], 200))
-        screen.blit(box_surface, (preview_x - 10, preview_y - 10))
-
-        # Draw border
-        pygame.draw.rect(screen, self.theme.text_dim,
-                        (preview_x - 10, preview_y - 10, preview_box_size + 20, preview_box_size + 20), 2)
+        # Draw preview box background and border (one cached surface)
+        bg_key = (theme.menu_bg, theme.text_dim)
+        if bg_key != self._preview_bg_key:
+            box_size = preview_box_size + 20
+            box_surface = pygame.Surface((box_size, box_size), pygame.SRCALPHA)
+            bg = theme.menu_bg
+            box_surface.fill((bg[0], bg[1], bg[2], 200))
+            pygame.draw.rect(box_surface, theme.text_dim, (0, 0, box_size, box_size), 2)
+            self._preview_bg_surf = box_surface
+            self._preview_bg_key = bg_key
+        screen.blit(self._preview_bg_surf, (preview_x - 10, preview_y - 10))
 
         # Draw pattern
         data = pattern.data
         h, w = data.shape
 
-        # Calculate scale to fit in preview box
-        scale = min(preview_box_size // max(w, 1), preview_box_size // max(h, 1), 8)
-        scale = max(1, scale)
-
-        offset_x = preview_x + (preview_box_size - w * scale) // 2
-        offset_y = preview_y + (preview_box_size - h * scale) // 2
-
-        cell_color = self.theme.cell_alive
+        cell_color = theme.cell_alive
+        key = (pattern.name, cell_color)
+        preview_surf = self._preview_lru.get(key)
+        if preview_surf is None:
+            # Largest scale (up to 8px per cell) that fits the longer side
+            scale = max(1, min(preview_box_size // max(w, h, 1), 8))
+            preview_surf = self._build_preview_surface(data, scale, cell_color)
+            self._preview_lru[key] = preview_surf
+            if len(self._preview_lru) > PREVIEW_CACHE_SIZE:
+                self._preview_lru.popitem(last=False)
+        else:
+            self._preview_lru.move_to_end(key)
 
-        for row in range(h):
-            for col in range(w):
-                if data[row, col]:
-                    pygame.draw.rect(
-                        screen,
-                        cell_color,
-                        (offset_x + col * scale,
-                         offset_y + row * scale,
-                         scale - 1 if scale > 2 else scale,
-                         scale - 1 if scale > 2 else scale)
-                    )
+        # Center the preview in the box
+        preview_w, preview_h = preview_surf.get_size()
+        offset_x = preview_x + (preview_box_size - preview_w) // 2
+        offset_y = preview_y + (preview_box_size - preview_h) // 2
+        screen.blit(preview_surf, (offset_x, offset_y))
 
         # Draw pattern name below preview
-        name_surface = self.font_medium.render(pattern.name.upper(), self.theme.text)
+        name_surface = self._cached_render(self._upper(pattern.name), theme.text, self.font_medium)
         name_rect = name_surface.get_rect(center=(preview_x + preview_box_size // 2, preview_y + preview_box_size + 25))
         screen.blit(name_surface, name_rect)
 
         # Draw pattern dimensions
         dim_text = f"{w}X{h}"
-        dim_surface = self.font_small.render(dim_text, self.theme.subtitle)
+        dim_surface = self._cached_render(dim_text, theme.subtitle, self.font_small)
         dim_rect = dim_surface.get_rect(center=(preview_x + preview_box_size // 2, preview_y + preview_box_size + 50))
         screen.blit(dim_surface, dim_rect)
 
+    @staticmethod
+    def _build_preview_surface(data: np.ndarray, scale: int,
+                               cell_color: Tuple[int, int, int]) -> pygame.Surface:
+        """Draw pattern data at scale px per cell; dead cells are transparent."""
+        h, w = data.shape
+
+        # One cell's footprint: cells larger than 2px keep a 1px gap
+        cell = np.zeros((scale, scale), dtype=bool)
+        cell_px = scale - 1 if scale > 2 else scale
+        cell[:cell_px, :cell_px] = True
+        mask = np.kron(data.astype(bool), cell)
+
+        surface = pygame.Surface((w * scale, h * scale), pygame.SRCALPHA)
+        surface.fill(cell_color)
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[:] = mask.T * 255
+        del alpha  # Unlock the surface
+        return surface
+
     def handle_event(self, event) -> Optional[str]:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
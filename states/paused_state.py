@@ -2,20 +2,28 @@
 import pygame
 from typing import Optional
 from .state_machine import State
-from input.controller import Button
+from .sim_controls import SimulationControls
+from input.controller import Button, AxisRepeat
 import config
 
 
-class PausedState(State):
+class PausedState(SimulationControls, State):
     """State when simulation is paused."""
 
+    # Buttons that leave the paused state, checked in priority order
+    _EXIT_BUTTONS = (
+        (Button.A.mask, "running"),
+        (Button.B.mask, "menu"),
+        (Button.Y.mask, "editor"),
+    )
+
     @property
     def name(self) -> str:
         return "paused"
 
     def __init__(self, game):
         super().__init__(game)
-        self.zoom_cooldown = 0.0
+        self.zoom_repeat = AxisRepeat()
 
     def enter(self, prev_state=None):
         # Inherit speed from running state if available
@@ -46,71 +54,62 @@ class PausedState(State):
         # Update HUD timers
         self.game.hud.update(dt)
 
-        # Tick cooldowns
-        if self.zoom_cooldown > 0:
-            self.zoom_cooldown -= dt
-
         # Handle controller input
         self._handle_controller_input()
+        if self.game.state_machine.current_state is not self:
+            return  # A button switched states; the rest of this frame is theirs
 
         # Handle keyboard panning
         self._handle_keyboard_pan()
 
+    def idle_timeout(self) -> int:
+        # Nothing animates while paused unless a notification is showing
+        # or the view is being panned with held keys or the stick
+        if self.game.hud.theme_notification:
+            return 0
+        keys = self.game.keys
+        if any(keys[key] for key, _, _ in self._PAN_KEYS):
+            return 0
+        if self.game.controller.get_left_stick() != (0, 0):
+            return 0
+        return config.IDLE_FRAME_MS
+
     def _handle_keyboard_pan(self):
         """Handle keyboard panning with held keys."""
-        keys = pygame.key.get_pressed()
+        keys = self.game.keys
 
         dx = dy = 0
-        if keys[pygame.K_LEFT]:
-            dx -= config.PAN_SPEED
-        if keys[pygame.K_RIGHT]:
-            dx += config.PAN_SPEED
-        if keys[pygame.K_UP]:
-            dy -= config.PAN_SPEED
-        if keys[pygame.K_DOWN]:
-            dy += config.PAN_SPEED
+        for key, kx, ky in self._PAN_KEYS:
+            if keys[key]:
+                dx += kx
+                dy += ky
 
         if dx or dy:
-            self.game.viewport.pan(dx, dy)
+            self.game.viewport.pan(dx * config.PAN_SPEED, dy * config.PAN_SPEED)
 
     def _handle_controller_input(self):
         """Handle controller input for paused state."""
         ctrl = self.game.controller
-
-        # A button: Resume
-        if ctrl.just_pressed(Button.A):
-            self.game.state_machine.change_state("running")
-            return
-
-        # B button: Open menu
-        if ctrl.just_pressed(Button.B):
-            self.game.state_machine.change_state("menu")
-            return
-
-        # Y button: Toggle editor
-        if ctrl.just_pressed(Button.Y):
-            self.game.state_machine.change_state("editor")
-            return
-
-        # X button: Single step (no pan)
-        if ctrl.just_pressed(Button.X):
-            self.game.grid.step()
-
-        # L/R: Adjust speed (for when resumed)
-        if ctrl.just_pressed(Button.L):
-            self.speed = max(config.MIN_SPEED, self.speed - 1)
-        if ctrl.just_pressed(Button.R):
-            self.speed = min(config.MAX_SPEED, self.speed + 1)
-
-        # D-pad: Pan viewport
-        if ctrl.just_pressed(Button.DPAD_UP):
-            self.game.viewport.pan(0, -1)
-        elif ctrl.just_pressed(Button.DPAD_DOWN):
-            self.game.viewport.pan(0, 1)
-        elif ctrl.just_pressed(Button.DPAD_LEFT):
-            self.game.viewport.pan(-1, 0)
-        elif ctrl.just_pressed(Button.DPAD_RIGHT):
-            self.game.viewport.pan(1, 0)
+        pressed = ctrl.just_pressed_mask()
+
+        if pressed:
+            # A: resume, B: menu, Y: editor
+            for mask, state in self._EXIT_BUTTONS:
+                if pressed & mask:
+                    self.game.state_machine.change_state(state)
+                    return
+
+            for mask, action in self._BUTTON_ACTIONS:
+                if pressed & mask:
+                    action(self)
+                    if self.game.state_machine.current_state is not self:
+                        return  # Left the state; stop handling input
+
+            # D-pad: Pan viewport (one direction per frame)
+            for mask, dx, dy in self._DPAD_PANS:
+                if pressed & mask:
+                    self.game.viewport.pan(dx, dy)
+                    break
 
         # Left stick: Pan viewport
         lx, ly = ctrl.get_left_stick()
@@ -120,28 +119,13 @@ class PausedState(State):
                 ly * config.PAN_SPEED
             )
 
-        # Right stick: Zoom (with cooldown)
+        # Right stick: Zoom (instant on push, repeats while held)
         rx, ry = ctrl.get_right_stick()
-        if self.zoom_cooldown <= 0:
-            if ry < -0.5:
-                self.game.viewport.zoom_in()
-                self.zoom_cooldown = 0.3
-            elif ry > 0.5:
-                self.game.viewport.zoom_out()
-                self.zoom_cooldown = 0.3
-
-        # L3: Cycle theme
-        if ctrl.just_pressed(Button.L3):
-            theme_name = self.game.renderer.cycle_theme()
-            self.game.hud.notify_theme_change(theme_name)
-
-        # Start: Open menu
-        if ctrl.just_pressed(Button.START):
-            self.game.state_machine.change_state("menu")
-
-        # Select: Reset/Clear
-        if ctrl.just_pressed(Button.SELECT):
-            self.game.grid.clear()
+        zoom = self.zoom_repeat.update(ry)
+        if zoom < 0:
+            self.game.viewport.zoom_in()
+        elif zoom > 0:
+            self.game.viewport.zoom_out()
 
     def render(self):
         self.game.renderer.clear()
@@ -169,9 +153,9 @@ class PausedState(State):
                 # Single step
                 self.game.grid.step()
             elif event.key == pygame.K_EQUALS or event.key == pygame.K_PLUS:
-                self.speed = min(config.MAX_SPEED, self.speed + 1)
+                self._speed_up()
             elif event.key == pygame.K_MINUS:
-                self.speed = max(config.MIN_SPEED, self.speed - 1)
+                self._speed_down()
             elif event.key == pygame.K_c:
                 self.game.grid.clear()
             elif event.key == pygame.K_h:
@@ -181,7 +165,6 @@ class PausedState(State):
             elif event.key == pygame.K_PAGEDOWN:
                 self.game.viewport.zoom_out()
             elif event.key == pygame.K_t:
-                theme_name = self.game.renderer.cycle_theme()
-                self.game.hud.notify_theme_change(theme_name)
+                self._cycle_theme()
 
         return None
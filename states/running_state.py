@@ -2,13 +2,28 @@
 import pygame
 from typing import Optional
 from .state_machine import State
-from input.controller import Button, Axis
+from .sim_controls import SimulationControls
+from input.controller import Button, Axis, AxisRepeat
 import config
 
 
-class RunningState(State):
+class RunningState(SimulationControls, State):
     """State when simulation is running."""
 
+    # Buttons that leave the running state, checked in priority order
+    _EXIT_BUTTONS = (
+        (Button.A.mask, "paused"),
+        (Button.B.mask, "menu"),
+        (Button.Y.mask, "editor"),
+    )
+
+    # Keys that leave the running state
+    _KEY_STATES = {
+        pygame.K_ESCAPE: "menu",
+        pygame.K_SPACE: "paused",
+        pygame.K_e: "editor",
+    }
+
     @property
     def name(self) -> str:
         return "running"
@@ -17,7 +32,29 @@ class RunningState(State):
         super().__init__(game)
         self.speed = config.DEFAULT_SPEED
         self.time_accumulator = 0.0
-        self.zoom_cooldown = 0.0
+        self.zoom_repeat = AxisRepeat()
+
+        # Config values read every frame, bound once
+        self._pan_speed = config.PAN_SPEED
+        self._max_steps = config.MAX_STEPS_PER_FRAME
+
+        self._build_keydown_dispatch()
+
+    def _build_keydown_dispatch(self):
+        """Map KEYDOWN keys to in-state actions."""
+        renderer = self.game.renderer
+        self._keydown_dispatch = {
+            pygame.K_EQUALS: self._speed_up,
+            pygame.K_PLUS: self._speed_up,
+            pygame.K_MINUS: self._speed_down,
+            pygame.K_c: self.game.grid.clear,
+            pygame.K_r: self.game.grid.randomize,
+            pygame.K_h: self.game.hud.toggle_visibility,
+            pygame.K_g: lambda: setattr(renderer, 'show_grid_lines', not renderer.show_grid_lines),
+            pygame.K_PAGEUP: self.game.viewport.zoom_in,
+            pygame.K_PAGEDOWN: self.game.viewport.zoom_out,
+            pygame.K_t: self._cycle_theme,
+        }
 
     def enter(self, prev_state=None):
         pass
@@ -32,12 +69,10 @@ class RunningState(State):
         # Update HUD timers
         self.game.hud.update(dt)
 
-        # Tick cooldowns
-        if self.zoom_cooldown > 0:
-            self.zoom_cooldown -= dt
-
         # Handle controller input
         self._handle_controller_input()
+        if self.game.state_machine.current_state is not self:
+            return  # A button switched states; the rest of this frame is theirs
 
         # Handle keyboard panning
         self._handle_keyboard_pan()
@@ -45,102 +80,67 @@ class RunningState(State):
         # Accumulate time for simulation steps
         self.time_accumulator += dt
 
-        step_time = 1.0 / self.speed if self.speed > 0 else float('inf')
-
-        while self.time_accumulator >= step_time:
-            self.game.grid.step()
-            self.time_accumulator -= step_time
+        # Run every generation due this frame in one batch
+        if self.speed > 0:
+            steps = int(self.time_accumulator * self.speed)
+            if steps > self._max_steps:
+                steps = self._max_steps
+                self.time_accumulator = 0.0
+            else:
+                self.time_accumulator -= steps / self.speed
+            self.game.grid.step_n(steps)
 
     def _handle_controller_input(self):
         """Handle controller input for running state."""
         ctrl = self.game.controller
-
-        # A button: Toggle pause
-        if ctrl.just_pressed(Button.A):
-            self.game.state_machine.change_state("paused")
-            return
-
-        # B button: Open menu
-        if ctrl.just_pressed(Button.B):
-            self.game.state_machine.change_state("menu")
-            return
-
-        # Y button: Toggle editor
-        if ctrl.just_pressed(Button.Y):
-            self.game.state_machine.change_state("editor")
-            return
-
-        # X button: Single step (without pan)
-        if ctrl.just_pressed(Button.X):
-            self.game.grid.step()
-
-        # L/R: Adjust speed
-        if ctrl.just_pressed(Button.L):
-            self.speed = max(config.MIN_SPEED, self.speed - 1)
-        if ctrl.just_pressed(Button.R):
-            self.speed = min(config.MAX_SPEED, self.speed + 1)
-
-        # D-pad: Step + Pan (useful for following gliders)
-        if ctrl.just_pressed(Button.DPAD_UP):
-            self.game.grid.step()
-            self.game.viewport.pan(0, -1)
-        elif ctrl.just_pressed(Button.DPAD_DOWN):
-            self.game.grid.step()
-            self.game.viewport.pan(0, 1)
-        elif ctrl.just_pressed(Button.DPAD_LEFT):
-            self.game.grid.step()
-            self.game.viewport.pan(-1, 0)
-        elif ctrl.just_pressed(Button.DPAD_RIGHT):
-            self.game.grid.step()
-            self.game.viewport.pan(1, 0)
+        pressed = ctrl.just_pressed_mask()
+
+        if pressed:
+            # A: pause, B: menu, Y: editor
+            for mask, state in self._EXIT_BUTTONS:
+                if pressed & mask:
+                    self.game.state_machine.change_state(state)
+                    return
+
+            # D-pad: Step + Pan (useful for following gliders)
+            for mask, dx, dy in self._DPAD_PANS:
+                if pressed & mask:
+                    self.game.grid.step()
+                    self.game.viewport.pan(dx, dy)
+                    break
+
+            for mask, action in self._BUTTON_ACTIONS:
+                if pressed & mask:
+                    action(self)
+                    if self.game.state_machine.current_state is not self:
+                        return  # Left the state; stop handling input
 
         # Left stick: Pan viewport
         lx, ly = ctrl.get_left_stick()
-        if lx != 0 or ly != 0:
-            self.game.viewport.pan(
-                lx * config.PAN_SPEED,
-                ly * config.PAN_SPEED
-            )
+        if lx or ly:
+            pan_speed = self._pan_speed
+            self.game.viewport.pan(lx * pan_speed, ly * pan_speed)
 
-        # Right stick: Zoom (with cooldown)
+        # Right stick: Zoom (instant on push, repeats while held)
         rx, ry = ctrl.get_right_stick()
-        if self.zoom_cooldown <= 0:
-            if ry < -0.5:
-                self.game.viewport.zoom_in()
-                self.zoom_cooldown = 0.3
-            elif ry > 0.5:
-                self.game.viewport.zoom_out()
-                self.zoom_cooldown = 0.3
-
-        # L3: Cycle theme
-        if ctrl.just_pressed(Button.L3):
-            theme_name = self.game.renderer.cycle_theme()
-            self.game.hud.notify_theme_change(theme_name)
-
-        # Start: Open menu
-        if ctrl.just_pressed(Button.START):
-            self.game.state_machine.change_state("menu")
-
-        # Select: Reset/Clear
-        if ctrl.just_pressed(Button.SELECT):
-            self.game.grid.clear()
+        zoom = self.zoom_repeat.update(ry)
+        if zoom < 0:
+            self.game.viewport.zoom_in()
+        elif zoom > 0:
+            self.game.viewport.zoom_out()
 
     def _handle_keyboard_pan(self):
         """Handle keyboard panning."""
-        keys = pygame.key.get_pressed()
+        keys = self.game.keys
 
         dx = dy = 0
-        if keys[pygame.K_LEFT]:
-            dx -= config.PAN_SPEED
-        if keys[pygame.K_RIGHT]:
-            dx += config.PAN_SPEED
-        if keys[pygame.K_UP]:
-            dy -= config.PAN_SPEED
-        if keys[pygame.K_DOWN]:
-            dy += config.PAN_SPEED
+        for key, kx, ky in self._PAN_KEYS:
+            if keys[key]:
+                dx += kx
+                dy += ky
 
         if dx or dy:
-            self.game.viewport.pan(dx, dy)
+            self.game.viewport.pan(dx * self._pan_speed, dy * self._pan_speed)
 
     def render(self):
         self.game.renderer.clear()
@@ -158,30 +158,12 @@ class RunningState(State):
 
     def handle_event(self, event) -> Optional[str]:
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                return "menu"
-            elif event.key == pygame.K_SPACE:
-                return "paused"
-            elif event.key == pygame.K_e:
-                return "editor"
-            elif event.key == pygame.K_EQUALS or event.key == pygame.K_PLUS:
-                self.speed = min(config.MAX_SPEED, self.speed + 1)
-            elif event.key == pygame.K_MINUS:
-                self.speed = max(config.MIN_SPEED, self.speed - 1)
-            elif event.key == pygame.K_c:
-                self.game.grid.clear()
-            elif event.key == pygame.K_r:
-                self.game.grid.randomize()
-            elif event.key == pygame.K_h:
-                self.game.hud.toggle_visibility()
-            elif event.key == pygame.K_g:
-                self.game.renderer.show_grid_lines = not self.game.renderer.show_grid_lines
-            elif event.key == pygame.K_PAGEUP:
-                self.game.viewport.zoom_in()
-            elif event.key == pygame.K_PAGEDOWN:
-                self.game.viewport.zoom_out()
-            elif event.key == pygame.K_t:
-                theme_name = self.game.renderer.cycle_theme()
-                self.game.hud.notify_theme_change(theme_name)
+            next_state = self._KEY_STATES.get(event.key)
+            if next_state:
+                return next_state
+
+            handler = self._keydown_dispatch.get(event.key)
+            if handler:
+                handler()
 
         return None
@@ -0,0 +1,53 @@
+"""Input tables and actions shared by the running and paused states."""
+import pygame
+from input.controller import Button
+import config
+
+
+class SimulationControls:
+    """
+    Mixin for states that show the simulation grid.
+
+    Subclasses declare _EXIT_BUTTONS (mask, state name) and decide what the
+    d-pad does with _DPAD_PANS.
+    """
+
+    # Held arrow keys: pan direction per key
+    _PAN_KEYS = (
+        (pygame.K_LEFT, -1, 0),
+        (pygame.K_RIGHT, 1, 0),
+        (pygame.K_UP, 0, -1),
+        (pygame.K_DOWN, 0, 1),
+    )
+
+    # Buttons that leave the state, checked in priority order
+    _EXIT_BUTTONS = ()
+
+    # Remaining button actions, run for every button pressed this frame
+    _BUTTON_ACTIONS = (
+        (Button.X.mask, lambda s: s.game.grid.step()),  # Single step (no pan)
+        (Button.L.mask, lambda s: s._speed_down()),
+        (Button.R.mask, lambda s: s._speed_up()),
+        (Button.L3.mask, lambda s: s._cycle_theme()),
+        (Button.START.mask, lambda s: s.game.state_machine.change_state("menu")),
+        (Button.SELECT.mask, lambda s: s.game.grid.clear()),  # Reset/Clear
+    )
+
+    # D-pad: one-cell pan direction per button (first hit wins)
+    _DPAD_PANS = (
+        (Button.DPAD_UP.mask, 0, -1),
+        (Button.DPAD_DOWN.mask, 0, 1),
+        (Button.DPAD_LEFT.mask, -1, 0),
+        (Button.DPAD_RIGHT.mask, 1, 0),
+    )
+
+    def _speed_up(self):
+        self.speed = min(config.MAX_SPEED, self.speed + 1)
+
+    def _speed_down(self):
+        self.speed = max(config.MIN_SPEED, self.speed - 1)
+
+    def _cycle_theme(self):
+        """Cycle the color theme and announce it on the HUD."""
+        theme_name = self.game.renderer.cycle_theme()
+        self.game.hud.notify_theme_change(theme_name)
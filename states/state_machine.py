@@ -56,6 +56,15 @@ class State(ABC):
         """
         return None
 
+    def idle_timeout(self) -> int:
+        """
+        How long the main loop may block waiting for input.
+
+        Returns:
+            Timeout in milliseconds, or 0 to run at the full frame rate
+        """
+        return 0
+
 
 class StateMachine:
     """Manages game states and transitions."""
@@ -82,6 +91,8 @@ class StateMachine:
             return
 
         next_state = self.states[name]
+        if next_state is self.current_state:
+            return  # Already there; don't re-run exit/enter
 
         if self.current_state:
             self.current_state.exit(next_state)
@@ -107,6 +118,21 @@ class StateMachine:
             if next_state:
                 self.change_state(next_state)
 
+    def handle_events(self, events):
+        """
+        Pass a frame's batch of events to the current state.
+
+        Events after a state change go to the new state.
+        """
+        for event in events:
+            self.handle_event(event)
+
+    def idle_timeout(self) -> int:
+        """Get the current state's idle timeout in milliseconds."""
+        if self.current_state:
+            return self.current_state.idle_timeout()
+        return 0
+
     @property
     def state_name(self) -> str:
         """Get current state name."""
@@ -1,10 +1,13 @@
 """Pattern editor for placing and drawing cells."""
 import numpy as np
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 from engine.patterns import Pattern
 from display.viewport import Viewport
 import config
 
+# Cursor sub-cell resolution: positions are stored in 1/SUB_STEPS cell units
+SUB_STEPS = 16
+
 
 class Editor:
     """Cell editor with cursor and pattern placement."""
@@ -20,13 +23,17 @@ class Editor:
         self.grid_width = grid_width
         self.grid_height = grid_height
 
-        # Cursor position (float for smooth movement)
-        self.cursor_x = 0.0
-        self.cursor_y = 0.0
+        # Cursor position in sub-cell units (integers for smooth movement)
+        self.cursor_x_sub = 0
+        self.cursor_y_sub = 0
+        # Sub-step fractions carried between moves so slow stick input adds up
+        self._frac_x = 0.0
+        self._frac_y = 0.0
 
         # Current pattern (None = single cell mode)
         self.current_pattern: Optional[Pattern] = None
         self.pattern_rotation = 0  # 0, 90, 180, 270
+        self._rot_cache: Dict[int, np.ndarray] = {}  # rotation -> contiguous data
 
         # Drawing state
         self.is_drawing = False
@@ -37,7 +44,7 @@ class Editor:
     @property
     def cursor_cell(self) -> Tuple[int, int]:
         """Get cursor position as integer cell coordinates."""
-        return (int(self.cursor_x), int(self.cursor_y))
+        return (self.cursor_x_sub // SUB_STEPS, self.cursor_y_sub // SUB_STEPS)
 
     def move_cursor(self, dx: float, dy: float, wrap: bool = True):
         """
@@ -48,37 +55,50 @@ class Editor:
             dy: Vertical movement
             wrap: Whether to wrap at grid edges
         """
-        self.cursor_x += dx * self.cursor_speed
-        self.cursor_y += dy * self.cursor_speed
+        self._frac_x += dx * self.cursor_speed * SUB_STEPS
+        self._frac_y += dy * self.cursor_speed * SUB_STEPS
+        step_x = int(self._frac_x)
+        step_y = int(self._frac_y)
+        self._frac_x -= step_x
+        self._frac_y -= step_y
+        x = self.cursor_x_sub + step_x
+        y = self.cursor_y_sub + step_y
 
         if wrap:
-            self.cursor_x = self.cursor_x % self.grid_width
-            self.cursor_y = self.cursor_y % self.grid_height
+            self.cursor_x_sub = x % (self.grid_width * SUB_STEPS)
+            self.cursor_y_sub = y % (self.grid_height * SUB_STEPS)
         else:
-            self.cursor_x = max(0, min(self.cursor_x, self.grid_width - 1))
-            self.cursor_y = max(0, min(self.cursor_y, self.grid_height - 1))
+            self.cursor_x_sub = max(0, min(x, (self.grid_width - 1) * SUB_STEPS))
+            self.cursor_y_sub = max(0, min(y, (self.grid_height - 1) * SUB_STEPS))
 
     def move_cursor_cells(self, dx: int, dy: int, wrap: bool = True):
         """Move cursor by whole cells."""
-        self.cursor_x = int(self.cursor_x) + dx
-        self.cursor_y = int(self.cursor_y) + dy
+        cx, cy = self.cursor_cell
+        x = cx + dx
+        y = cy + dy
 
         if wrap:
-            self.cursor_x = self.cursor_x % self.grid_width
-            self.cursor_y = self.cursor_y % self.grid_height
+            x %= self.grid_width
+            y %= self.grid_height
         else:
-            self.cursor_x = max(0, min(self.cursor_x, self.grid_width - 1))
-            self.cursor_y = max(0, min(self.cursor_y, self.grid_height - 1))
+            x = max(0, min(x, self.grid_width - 1))
+            y = max(0, min(y, self.grid_height - 1))
+
+        self.cursor_x_sub = x * SUB_STEPS
+        self.cursor_y_sub = y * SUB_STEPS
+        self._frac_x = self._frac_y = 0.0
 
     def set_cursor(self, x: int, y: int):
         """Set cursor to specific position."""
-        self.cursor_x = float(x)
-        self.cursor_y = float(y)
+        self.cursor_x_sub = x * SUB_STEPS
+        self.cursor_y_sub = y * SUB_STEPS
+        self._frac_x = self._frac_y = 0.0
 
     def set_pattern(self, pattern: Optional[Pattern]):
         """Set current pattern for stamping."""
         self.current_pattern = pattern
         self.pattern_rotation = 0
+        self._rot_cache.clear()
 
     def rotate_pattern(self):
         """Rotate current pattern 90 degrees clockwise."""
@@ -89,9 +109,13 @@ class Editor:
         if self.current_pattern is None:
             return None
 
-        data = self.current_pattern.data
-        rotations = (self.pattern_rotation // 90) % 4
-        return np.rot90(data, -rotations)
+        data = self._rot_cache.get(self.pattern_rotation)
+        if data is None:
+            rotations = (self.pattern_rotation // 90) % 4
+            # Contiguous copy so stamping is a straight copy, not a strided one
+            data = np.ascontiguousarray(np.rot90(self.current_pattern.data, -rotations))
+            self._rot_cache[self.pattern_rotation] = data
+        return data
 
     def get_pattern_size(self) -> Tuple[int, int]:
         """Get current pattern size (width, height) with rotation."""
@@ -104,8 +128,7 @@ class Editor:
     def center_on_viewport(self, viewport: Viewport):
         """Center cursor on current viewport."""
         vx, vy, vw, vh = viewport.get_visible_region()
-        self.cursor_x = float(vx + vw // 2)
-        self.cursor_y = float(vy + vh // 2)
+        self.set_cursor(vx + vw // 2, vy + vh // 2)
 
     def follow_viewport(self, viewport: Viewport):
         """Ensure cursor stays visible in viewport."""
@@ -113,15 +136,14 @@ class Editor:
 
         margin = 2  # Keep cursor this many cells from edge
 
-        # Adjust viewport to follow cursor if needed
+        # Adjust viewport to follow cursor if needed: clamp its origin so the
+        # cursor sits between the margins (fractional origins are kept if inside)
         cx, cy = self.cursor_cell
 
-        if cx < vx + margin:
-            viewport.x = cx - margin
-        elif cx >= vx + vw - margin:
-            viewport.x = cx - vw + margin + 1
+        x = min(max(vx, cx - vw + margin + 1), cx - margin)
+        if x != vx:
+            viewport.x = x
 
-        if cy < vy + margin:
-            viewport.y = cy - margin
-        elif cy >= vy + vh - margin:
-            viewport.y = cy - vh + margin + 1
+        y = min(max(vy, cy - vh + margin + 1), cy - margin)
+        if y != vy:
+            viewport.y = y
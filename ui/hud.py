@@ -1,13 +1,38 @@
 """Heads-up display for game information."""
 import pygame
+from collections import OrderedDict
+from typing import Optional, Tuple
 from display.renderer import Renderer
 from display.pixelfont import PixelFont
 from engine.grid import Grid
 
+# Rendered HUD strings kept around; counters churn, labels and hints stay hot
+TEXT_CACHE_SIZE = 64
+
 
 class HUD:
     """Heads-up display showing game stats with retro pixel aesthetic."""
 
+    # Control hints per state, by input method
+    _HINTS_CONTROLLER = {
+        'running': ("A:PAUSE", "B:MENU", "Y:EDIT", "L/R:SPEED", "T:THEME"),
+        'paused': ("A:RESUME", "B:MENU", "Y:EDIT", "X:STEP", "T:THEME"),
+        'editor': ("A:PLACE", "B:EXIT", "Y:ROTATE", "SEL:PATTERNS"),
+    }
+    _HINTS_KEYBOARD = {
+        'running': ("SPACE:PAUSE", "ESC:MENU", "E:EDIT", "+/-:SPEED", "T:THEME"),
+        'paused': ("SPACE:RESUME", "ESC:MENU", "E:EDIT", "N:STEP", "T:THEME"),
+        'editor': ("ENTER:PLACE", "ESC:EXIT", "R:ROTATE", "P:PATTERNS"),
+    }
+
+    # The same hints as the single line drawn in the bottom bar
+    _HINTS_CONTROLLER_JOINED = {
+        state: "  |  ".join(hints) for state, hints in _HINTS_CONTROLLER.items()
+    }
+    _HINTS_KEYBOARD_JOINED = {
+        state: "  |  ".join(hints) for state, hints in _HINTS_KEYBOARD.items()
+    }
+
     def __init__(self):
         """Initialize HUD."""
         self.visible = True
@@ -21,6 +46,21 @@ class HUD:
         self.theme_notification = None
         self.theme_notification_timer = 0.0
 
+        # Rendered strings keyed by (text, color, scale), oldest first
+        self._text_cache: OrderedDict = OrderedDict()
+
+        # Bars drawn with their contents, rebuilt only when what they show changes
+        self._top_bar_cache: Optional[pygame.Surface] = None
+        self._top_bar_key = None
+        self._hints_bar_cache: Optional[pygame.Surface] = None
+        self._hints_bar_key = None
+
+        # Theme notification box and border at full opacity; faded per frame
+        # with set_alpha, rebuilt only when the width or theme changes
+        self._notify_box_cache: Optional[pygame.Surface] = None
+        self._notify_border_cache: Optional[pygame.Surface] = None
+        self._notify_key = None
+
     def notify_theme_change(self, theme_name: str):
         """Show a brief notification when theme changes."""
         self.theme_notification = theme_name.upper()
@@ -33,6 +73,36 @@ class HUD:
             if self.theme_notification_timer <= 0:
                 self.theme_notification = None
 
+    def _cached_render(self, text: str, color: Tuple[int, int, int],
+                       font: PixelFont) -> pygame.Surface:
+        """Render text through the LRU string cache."""
+        key = (text, color, font.scale)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, color)
+            self._text_cache[key] = surface
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
+
+    def _render_counter(self, screen: pygame.Surface, prefix: str, value: int,
+                        color: Tuple[int, int, int], x: int, y: int) -> int:
+        """
+        Draw "PREFIX 1,234" in the large font as a cached label plus number.
+
+        Returns:
+            Width of the drawn text
+        """
+        label = self._cached_render(prefix + " ", color, self.font_large)
+        number = self._cached_render(f"{value:,}", color, self.font_large)
+        screen.blit(label, (x, y))
+        # Same advance as if the two parts were rendered as one string
+        number_x = x + label.get_width() + 1
+        screen.blit(number, (number_x, y))
+        return number_x + number.get_width() - x
+
     def render(self, renderer: Renderer, grid: Grid, speed: int,
                state_name: str, controller_connected: bool = False):
         """
@@ -67,93 +137,95 @@ class HUD:
 
     def _render_top_bar(self, screen: pygame.Surface, screen_w: int,
                         theme, grid: Grid, speed: int, state_name: str):
-        """Render the top information bar."""
+        """Render the top information bar (redrawn only when its contents change)."""
+        population = grid.population()
+        key = (screen_w, id(theme), grid.generation, population, speed, state_name)
+        if key != self._top_bar_key:
+            self._top_bar_cache = self._build_top_bar(screen_w, theme, grid.generation,
+                                                      population, speed, state_name)
+            self._top_bar_key = key
+        screen.blit(self._top_bar_cache, (0, 0))
+
+    def _build_top_bar(self, screen_w: int, theme, generation: int,
+                       population: int, speed: int, state_name: str) -> pygame.Surface:
+        """Draw the top bar and its contents onto a translucent surface."""
         bar_height = 28
         padding = 8
 
         # Semi-transparent background bar
-        bar_surface = pygame.Surface((screen_w, bar_height), pygame.SRCALPHA)
+        bar = pygame.Surface((screen_w, bar_height), pygame.SRCALPHA)
         bg = theme.hud_bg
-        bar_surface.fill((bg[0], bg[1], bg[2], 200))
-        screen.blit(bar_surface, (0, 0))
+        bar.fill((bg[0], bg[1], bg[2], 200))
 
         # Bottom border line
-        pygame.draw.line(screen, theme.text_dim,
+        pygame.draw.line(bar, theme.text_dim,
                         (0, bar_height - 1), (screen_w, bar_height - 1))
 
         # Left side: Generation and Population
-        gen_text = f"GEN {grid.generation:,}"
-        gen_surface = self.font_large.render(gen_text, theme.title)
-        screen.blit(gen_surface, (padding, 6))
+        gen_width = self._render_counter(bar, "GEN", generation,
+                                         theme.title, padding, 6)
 
         # Population after generation
-        gen_width = gen_surface.get_width()
-        pop_text = f"POP {grid.population():,}"
-        pop_surface = self.font_large.render(pop_text, theme.text)
-        screen.blit(pop_surface, (padding + gen_width + 20, 6))
+        self._render_counter(bar, "POP", population,
+                             theme.text, padding + gen_width + 20, 6)
 
         # Right side: Speed and State
         # State indicator (highlighted)
         state_text = state_name.upper()
-        state_surface = self.font_large.render(state_text, theme.text_highlight)
+        state_surface = self._cached_render(state_text, theme.text_highlight, self.font_large)
         state_x = screen_w - padding - state_surface.get_width()
-        screen.blit(state_surface, (state_x, 6))
+        bar.blit(state_surface, (state_x, 6))
 
         # Speed indicator
         speed_text = f"{speed} GEN/S"
-        speed_surface = self.font_small.render(speed_text, theme.subtitle)
+        speed_surface = self._cached_render(speed_text, theme.subtitle, self.font_small)
         speed_x = state_x - speed_surface.get_width() - 20
-        screen.blit(speed_surface, (speed_x, 10))
+        bar.blit(speed_surface, (speed_x, 10))
 
         # Center: Small decorative separator dots
         center_x = screen_w // 2
         dot_color = theme.text_dim
         for i in range(-1, 2):
-            pygame.draw.rect(screen, dot_color,
+            pygame.draw.rect(bar, dot_color,
                            (center_x + i * 6, 12, 2, 2))
 
+        return bar
+
     def _render_hints(self, screen: pygame.Surface, screen_w: int, screen_h: int,
                       theme, state_name: str, controller_connected: bool):
-        """Render control hints at bottom of screen."""
-        hints = self._get_hints(state_name, controller_connected)
+        """Render control hints at bottom of screen (redrawn only when they change)."""
+        hints_joined = (self._HINTS_CONTROLLER_JOINED if controller_connected
+                        else self._HINTS_KEYBOARD_JOINED)
+        hint_text = hints_joined.get(state_name)
 
-        if not hints:
+        if not hint_text:
             return
 
+        key = (screen_w, id(theme), hint_text)
+        if key != self._hints_bar_key:
+            self._hints_bar_cache = self._build_hints_bar(screen_w, theme, hint_text)
+            self._hints_bar_key = key
+        screen.blit(self._hints_bar_cache,
+                    (0, screen_h - self._hints_bar_cache.get_height()))
+
+    def _build_hints_bar(self, screen_w: int, theme, hint_text: str) -> pygame.Surface:
+        """Draw the hints bar and its text onto a translucent surface."""
         bar_height = 22
-        y = screen_h - bar_height
 
         # Semi-transparent background bar
-        bar_surface = pygame.Surface((screen_w, bar_height), pygame.SRCALPHA)
+        bar = pygame.Surface((screen_w, bar_height), pygame.SRCALPHA)
         bg = theme.hud_bg
-        bar_surface.fill((bg[0], bg[1], bg[2], 180))
-        screen.blit(bar_surface, (0, y))
+        bar.fill((bg[0], bg[1], bg[2], 180))
 
         # Top border line
-        pygame.draw.line(screen, theme.text_dim, (0, y), (screen_w, y))
+        pygame.draw.line(bar, theme.text_dim, (0, 0), (screen_w, 0))
 
         # Render hints centered
-        hint_text = "  |  ".join(hints)
-        hint_surface = self.font_small.render(hint_text, theme.text_dim)
-        hint_rect = hint_surface.get_rect(center=(screen_w // 2, y + bar_height // 2 + 1))
-        screen.blit(hint_surface, hint_rect)
-
-    def _get_hints(self, state_name: str, controller_connected: bool) -> list:
-        """Get the appropriate hints for current state and input method."""
-        if controller_connected:
-            hints_map = {
-                'running': ["A:PAUSE", "B:MENU", "Y:EDIT", "L/R:SPEED", "T:THEME"],
-                'paused': ["A:RESUME", "B:MENU", "Y:EDIT", "X:STEP", "T:THEME"],
-                'editor': ["A:PLACE", "B:EXIT", "Y:ROTATE", "SEL:PATTERNS"],
-            }
-        else:
-            hints_map = {
-                'running': ["SPACE:PAUSE", "ESC:MENU", "E:EDIT", "+/-:SPEED", "T:THEME"],
-                'paused': ["SPACE:RESUME", "ESC:MENU", "E:EDIT", "N:STEP", "T:THEME"],
-                'editor': ["ENTER:PLACE", "ESC:EXIT", "R:ROTATE", "P:PATTERNS"],
-            }
+        hint_surface = self._cached_render(hint_text, theme.text_dim, self.font_small)
+        hint_rect = hint_surface.get_rect(center=(screen_w // 2, bar_height // 2 + 1))
+        bar.blit(hint_surface, hint_rect)
 
-        return hints_map.get(state_name, [])
+        return bar
 
     def _render_theme_notification(self, screen: pygame.Surface,
                                     screen_w: int, screen_h: int, theme):
@@ -163,25 +235,30 @@ class HUD:
 
         # Notification box in center-top area
         text = f"THEME: {self.theme_notification}"
-        text_surface = self.font_large.render(text, theme.title)
+        text_surface = self._cached_render(text, theme.title, self.font_large)
 
         box_width = text_surface.get_width() + 40
         box_height = 36
         box_x = (screen_w - box_width) // 2
         box_y = 50
 
+        key = (box_width, id(theme))
+        if key != self._notify_key:
+            # Opaque fill faded by surface alpha: SDL's plain alpha blit path
+            self._notify_box_cache = pygame.Surface((box_width, box_height))
+            self._notify_box_cache.fill(theme.menu_bg)
+            self._notify_border_cache = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+            pygame.draw.rect(self._notify_border_cache, theme.title,
+                            (0, 0, box_width, box_height), 2)
+            self._notify_key = key
+
         # Background
-        box_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        bg = theme.menu_bg
-        box_surface.fill((bg[0], bg[1], bg[2], min(220, alpha)))
-        screen.blit(box_surface, (box_x, box_y))
+        self._notify_box_cache.set_alpha(min(220, alpha))
+        screen.blit(self._notify_box_cache, (box_x, box_y))
 
         # Border
-        border_color = (*theme.title, min(255, alpha))
-        border_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        pygame.draw.rect(border_surface, border_color,
-                        (0, 0, box_width, box_height), 2)
-        screen.blit(border_surface, (box_x, box_y))
+        self._notify_border_cache.set_alpha(alpha)
+        screen.blit(self._notify_border_cache, (box_x, box_y))
 
         # Text (with alpha)
         text_surface.set_alpha(alpha)
@@ -1,5 +1,6 @@
 """Menu system for Game of Life."""
 import pygame
+import numpy as np
 from typing import List, Optional, Callable, Any
 from dataclasses import dataclass, field
 from display.renderer import Renderer
@@ -184,6 +185,10 @@ class PatternBrowser(Menu):
         self.patterns = patterns
         self.on_select = on_select
 
+        # Scaled preview of the selected pattern, rebuilt when the key changes
+        self._preview_surf: Optional[pygame.Surface] = None
+        self._preview_key = None
+
     def render(self, renderer: Renderer, x: int = None, y: int = None):
         """Render pattern browser with preview."""
         super().render(renderer, x, y)
@@ -212,16 +217,11 @@ class PatternBrowser(Menu):
         offset_x = preview_x + (160 - w * scale) // 2
         offset_y = preview_y + (160 - h * scale) // 2
 
-        for row in range(h):
-            for col in range(w):
-                if data[row, col]:
-                    pygame.draw.rect(
-                        renderer.screen,
-                        renderer.theme.cell_alive,
-                        (offset_x + col * scale,
-                         offset_y + row * scale,
-                         scale, scale)
-                    )
+        key = (id(pattern), scale, renderer.theme.cell_alive)
+        if key != self._preview_key:
+            self._preview_surf = self._build_preview(data, scale, renderer.theme.cell_alive)
+            self._preview_key = key
+        renderer.screen.blit(self._preview_surf, (offset_x, offset_y))
 
         # Pattern info
         renderer.render_text(
@@ -231,3 +231,16 @@ class PatternBrowser(Menu):
             size='small',
             center=True
         )
+
+    @staticmethod
+    def _build_preview(data: np.ndarray, scale: int, color) -> pygame.Surface:
+        """Draw pattern data at scale px per cell; dead cells are transparent."""
+        h, w = data.shape
+        mask = np.kron(data.astype(bool), np.ones((scale, scale), dtype=bool))
+
+        surface = pygame.Surface((w * scale, h * scale), pygame.SRCALPHA)
+        surface.fill(color)
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[:] = mask.T * 255
+        del alpha  # Unlock the surface
+        return surface